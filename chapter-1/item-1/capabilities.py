@@ -0,0 +1,272 @@
+"""
+What can this interpreter do, and how fast are the common ways of sorting, counting
+and taking GCDs on it?
+
+version.py prints sys.version. This goes further, the first time any of its
+results is used:
+
+    - the facts: Python version and implementation (CPython, PyPy, ...), NumPy
+      availability, usable CPU count and whether this is a free-threaded build with
+      the GIL actually off. The CPU count and GIL state can change from one run to
+      the next (CPU affinity, PYTHON_GIL), so they are detected fresh every time
+      and never come from the cache
+    - the timings: sorting, counting and GCDs are timed on a small list with the
+      standard library and, when it's installed, with NumPy, and the fastest of each
+      is reported. NumPy isn't always the winner; converting a list to an array
+      and back costs time too
+    - the result is cached as JSON, so only the first run pays for the timings
+      (and for importing NumPy). The cache key covers the interpreter, its version,
+      the installed NumPy and the cache format, so upgrading any of them probes again
+
+    import capabilities
+    capabilities.fastest           # {'sort': 'builtin', 'count': 'counter', ...}
+    capabilities.timings           # seconds per implementation
+    capabilities.probe_time        # seconds the probe took, when it ran
+    capabilities.load_time         # seconds spent getting the result
+
+    python capabilities.py             # print the report
+    python capabilities.py --refresh   # ignore the cache and probe again
+
+Set CAPABILITIES_CACHE to a directory to move the cache, or to "" to turn it off.
+
+This is a report, not a dispatcher: nothing else in the repo reads it. The library
+modules (sorting, coprime, columnar, ...) each check for NumPy themselves when they
+first need it, which keeps their imports cheap and the item directories independent.
+"""
+
+import hashlib
+import importlib.util
+import json
+import math
+import os
+import platform
+import random
+import sys
+import sysconfig
+from collections import Counter
+from time import perf_counter
+
+SAMPLE_SIZE = 20_000
+CACHE_VERSION = 3  # bump when the shape of the cached result changes
+CACHE_DIR = os.environ.get(
+    "CAPABILITIES_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "effective-python"),
+)
+
+
+def _sort_builtin(values):
+    return sorted(values)
+
+
+def _sort_numpy(values):
+    import numpy as np
+
+    return np.sort(np.asarray(values)).tolist()
+
+
+def _count_counter(values):
+    return Counter(values)
+
+
+def _count_numpy(values):
+    import numpy as np
+
+    found, counts = np.unique(np.asarray(values), return_counts=True)
+    return Counter(dict(zip(found.tolist(), counts.tolist())))
+
+
+def _gcd_math(a, b):
+    return list(map(math.gcd, a, b))
+
+
+def _gcd_numpy(a, b):
+    import numpy as np
+
+    return np.gcd(np.asarray(a), np.asarray(b)).tolist()
+
+
+IMPLEMENTATIONS = {
+    "sort": {"builtin": _sort_builtin, "numpy": _sort_numpy},
+    "count": {"counter": _count_counter, "numpy": _count_numpy},
+    "gcd": {"math": _gcd_math, "numpy": _gcd_numpy},
+}
+
+
+def cpu_count():
+    """CPUs this process may run on, which can be fewer than the machine has."""
+    if hasattr(os, "process_cpu_count"):
+        return os.process_cpu_count() or 1
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def free_threading():
+    """(free-threaded build, GIL currently disabled)."""
+    build = bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    return build, build and not gil_enabled
+
+
+def _numpy_spec():
+    spec = importlib.util.find_spec("numpy")
+    return spec.origin if spec is not None else None
+
+
+def cache_key():
+    """Cheap fingerprint of everything the probe result depends on.
+
+    NumPy is located but not imported; its install path and mtime stand in for its version.
+    """
+    numpy_origin = _numpy_spec()
+    numpy_mtime = os.path.getmtime(numpy_origin) if numpy_origin else None
+    parts = [
+        CACHE_VERSION, sys.executable, sys.version, platform.machine(), numpy_origin, numpy_mtime
+    ]
+    return hashlib.sha1(repr(parts).encode()).hexdigest()[:16]
+
+
+def _best(candidates, *args):
+    timings = {}
+    for name, fn in candidates.items():
+        fn(*args)  # warm up: imports, caches
+        start = perf_counter()
+        fn(*args)
+        timings[name] = perf_counter() - start
+    return min(timings, key=timings.get), timings
+
+
+def runtime():
+    """The facts that can differ between runs of the same interpreter."""
+    build, gil_disabled = free_threading()
+    cpus = cpu_count()
+    if cpus == 1:
+        parallel = "serial"
+    elif gil_disabled:
+        parallel = "threads"
+    else:
+        parallel = "processes"
+    return {
+        "cpu_count": cpus,
+        "free_threaded_build": build,
+        "gil_disabled": gil_disabled,
+        "parallel": parallel,
+    }
+
+
+def probe():
+    """Detect the interpreter and time each implementation. Slow; load() caches it."""
+    start = perf_counter()
+    numpy_version = None
+    if _numpy_spec() is not None:
+        try:
+            import numpy as np
+
+            numpy_version = np.__version__
+        except ImportError:
+            pass
+
+    usable = {
+        path: {
+            name: fn for name, fn in candidates.items() if name != "numpy" or numpy_version
+        }
+        for path, candidates in IMPLEMENTATIONS.items()
+    }
+    rng = random.Random(17)
+    values = [rng.randrange(1_000) for _ in range(SAMPLE_SIZE)]
+    other = [rng.randrange(1, 1_000_000) for _ in range(SAMPLE_SIZE)]
+    fastest, timings = {}, {}
+    fastest["sort"], timings["sort"] = _best(usable["sort"], values)
+    fastest["count"], timings["count"] = _best(usable["count"], values)
+    fastest["gcd"], timings["gcd"] = _best(usable["gcd"], values, other)
+
+    return {
+        "version": CACHE_VERSION,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "numpy": numpy_version,
+        "fastest": fastest,
+        "timings": timings,
+        "probe_time": perf_counter() - start,
+    }
+
+
+def _usable(cached):
+    """Whether a cached result has everything _select needs."""
+    try:
+        return cached["version"] == CACHE_VERSION and all(
+            cached["fastest"][path] in candidates and path in cached["timings"]
+            for path, candidates in IMPLEMENTATIONS.items()
+        )
+    except (KeyError, TypeError):
+        return False
+
+
+def load(refresh=False):
+    """The probe result, from the cache when it matches this interpreter.
+
+    Returns (result, whether it came from the cache). The runtime() facts are
+    added fresh either way.
+    """
+    path = None
+    if CACHE_DIR:
+        path = os.path.join(CACHE_DIR, f"capabilities-{cache_key()}.json")
+        if not refresh:
+            try:
+                with open(path, encoding="utf-8") as cached:
+                    result = json.load(cached)
+                if _usable(result):
+                    return {**result, **runtime()}, True
+            except (OSError, ValueError):
+                pass
+
+    result = probe()
+    if path:
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            temporary = f"{path}.{os.getpid()}.tmp"
+            with open(temporary, "w", encoding="utf-8") as out:
+                json.dump(result, out, indent=2)
+            os.replace(temporary, path)  # other processes never see half a file
+        except OSError:
+            pass  # a read-only home directory just means probing every time
+    return {**result, **runtime()}, False
+
+
+def _select(refresh=False):
+    global capabilities, from_cache, fastest, timings, probe_time, load_time
+    start = perf_counter()
+    capabilities, from_cache = load(refresh)
+    fastest = capabilities["fastest"]
+    timings = capabilities["timings"]
+    probe_time = capabilities["probe_time"]
+    load_time = perf_counter() - start
+
+
+def refresh():
+    """Probe again, ignoring (and replacing) the cache."""
+    _select(refresh=True)
+
+
+_SELECTED = {
+    "capabilities",
+    "from_cache",
+    "fastest",
+    "timings",
+    "probe_time",
+    "load_time",
+}
+
+
+def __getattr__(name):
+    # the probe (or the cache read) runs on first use, not on import
+    if name in _SELECTED:
+        _select()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+if __name__ == "__main__":
+    _select(refresh="--refresh" in sys.argv[1:])
+    print(json.dumps(capabilities, indent=2))
+    print(f"from cache: {from_cache}, load time: {load_time * 1000:.2f} ms")
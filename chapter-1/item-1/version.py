@@ -2,3 +2,6 @@ import sys
 
 print(sys.version)
 print(sys.version_info)
+
+# capabilities.py goes further: it detects NumPy, the CPU count and free-threading,
+# and reports how fast sorting, counting and GCDs are here, with and without NumPy
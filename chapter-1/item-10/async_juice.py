@@ -0,0 +1,68 @@
+"""
+asyncio version of the while fresh_fruit := pick_fruit() loop, for when pick_fruit
+polls the network and make_juice calls remote services.
+
+juice_stream takes async pick_fruit() / make_juice(fruit, count) callables and
+returns an async generator of bottles:
+
+    async for bottle in juice_stream(pick_fruit, make_juice, max_in_flight=32):
+        ...
+
+    - polling keeps going while earlier orders are still being juiced
+    - a semaphore caps how many orders are in flight. A slot is only freed once
+      the consumer has taken all of that order's bottles, so a slow consumer holds back
+      make_juice calls instead of piling up finished results
+    - ordered=True yields bottles in delivery order (like bottles.extend in the
+      loop). ordered=False yields each order's bottles as soon as they are ready
+    - bottles are streamed to the consumer instead of collected in a list.
+      collect() gathers them into one for callers that want the list anyway
+"""
+
+import asyncio
+
+_DONE = object()
+
+
+async def juice_stream(pick_fruit, make_juice, max_in_flight=16, ordered=True):
+    slots = asyncio.Semaphore(max_in_flight)
+    ready = asyncio.Queue()
+    pending = set()
+
+    async def produce():
+        try:
+            while fresh_fruit := await pick_fruit():
+                for fruit, count in fresh_fruit.items():
+                    await slots.acquire()
+                    task = asyncio.create_task(make_juice(fruit, count))
+                    pending.add(task)
+                    task.add_done_callback(pending.discard)
+                    if ordered:
+                        ready.put_nowait(task)
+                    else:
+                        task.add_done_callback(ready.put_nowait)
+            if not ordered and pending:
+                await asyncio.wait(pending)
+        finally:
+            ready.put_nowait(_DONE)
+
+    producer = asyncio.create_task(produce())
+    try:
+        while (task := await ready.get()) is not _DONE:
+            # the slot is held until the consumer has taken every bottle of the order
+            try:
+                for bottle in await task:
+                    yield bottle
+            finally:
+                slots.release()
+        await producer  # re-raise anything pick_fruit raised
+    finally:
+        producer.cancel()
+        for task in pending:
+            task.cancel()
+
+
+async def collect(pick_fruit, make_juice, max_in_flight=16, ordered=True):
+    return [
+        bottle
+        async for bottle in juice_stream(pick_fruit, make_juice, max_in_flight, ordered)
+    ]
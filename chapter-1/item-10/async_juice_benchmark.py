@@ -0,0 +1,81 @@
+"""
+Simulated network latency: pick_fruit takes POLL seconds per delivery and make_juice
+takes JUICE seconds per order. The sync loop pays every delay one after another,
+juice_stream overlaps them.
+
+    python async_juice_benchmark.py          # 200 deliveries
+    python async_juice_benchmark.py 50
+"""
+
+import asyncio
+import sys
+import time
+from time import perf_counter
+
+from async_juice import juice_stream
+
+POLL = 0.002
+JUICE = 0.010
+FRUIT = ("apple", "banana", "lemon")
+
+
+def deliveries(count):
+    return [{fruit: 1 + (i + j) % 3 for j, fruit in enumerate(FRUIT)} for i in range(count)]
+
+
+def sync_loop(count):
+    orders = iter(deliveries(count))
+
+    def pick_fruit():
+        time.sleep(POLL)
+        return next(orders, None)
+
+    def make_juice(fruit, count):
+        time.sleep(JUICE)
+        return [fruit] * count
+
+    bottles = 0
+    while fresh_fruit := pick_fruit():
+        for fruit, count in fresh_fruit.items():
+            bottles += len(make_juice(fruit, count))
+    return bottles
+
+
+async def async_engine(count, max_in_flight, ordered):
+    orders = iter(deliveries(count))
+
+    async def pick_fruit():
+        await asyncio.sleep(POLL)
+        return next(orders, None)
+
+    async def make_juice(fruit, count):
+        await asyncio.sleep(JUICE)
+        return [fruit] * count
+
+    bottles = 0
+    async for _ in juice_stream(pick_fruit, make_juice, max_in_flight, ordered):
+        bottles += 1
+    return bottles
+
+
+def timed(fn):
+    start = perf_counter()
+    bottles = fn()
+    elapsed = perf_counter() - start
+    return bottles, elapsed
+
+
+def main(count=200):
+    print(f"{count} deliveries, poll {POLL * 1000:.0f} ms, make_juice {JUICE * 1000:.0f} ms")
+    expected, elapsed = timed(lambda: sync_loop(count))
+    print(f"{'sync loop':>30}: {elapsed:7.3f} s  {expected / elapsed:9,.0f} bottles/s")
+    for max_in_flight in (4, 16, 64):
+        for ordered in (True, False):
+            bottles, elapsed = timed(lambda: asyncio.run(async_engine(count, max_in_flight, ordered)))
+            assert bottles == expected
+            label = f"asyncio in_flight={max_in_flight} {'ordered' if ordered else 'unordered'}"
+            print(f"{label:>30}: {elapsed:7.3f} s  {bottles / elapsed:9,.0f} bottles/s")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,120 @@
+"""
+Rule engine for the walrus if/elif cascade:
+
+    if (count := fresh_fruit.get("banana", 0)) >= 2: ...smoothies
+    elif (count := fresh_fruit.get("apple", 0)) >= 4: ...cider
+    elif count := fresh_fruit.get("lemon", 0): ...lemonade
+    else: "nothing"
+
+Written as rules that is [("banana", 2, smoothies), ("apple", 4, cider),
+("lemon", 1, lemonade)]: a rule matches when fresh_fruit.get(fruit, 0) >= threshold
+and the first matching rule wins. The cascade does one dict lookup per branch until
+something matches. RuleSet compiles the rules into an index instead:
+
+    - per fruit, the thresholds in ascending order alongside the lowest (earliest)
+      rule number at or below each threshold, so one bisect finds the first rule
+      that fruit's count can satisfy
+    - a snapshot with fewer fruits than the rules mention is walked by its own
+      items, so fruits it doesn't have cost nothing. Otherwise the rule fruits are
+      checked in order of their earliest rule, stopping as soon as no remaining
+      fruit could beat the best match so far
+    - rules with a threshold of 0 or less also match a missing fruit (count 0);
+      those are kept in rule order and checked separately
+
+match_many evaluates a whole batch of snapshots. With NumPy it fills a count
+matrix (snapshots x fruits) and applies the rules last to first as vectorized
+comparisons, so the earliest matching rule is the one left standing.
+"""
+
+from bisect import bisect_right
+from itertools import accumulate
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+NO_MATCH = -1
+
+
+class RuleSet:
+    def __init__(self, rules, default="nothing"):
+        self.rules = [tuple(rule) for rule in rules]
+        self.default = default
+
+        by_fruit = {}
+        for number, (fruit, threshold, _) in enumerate(self.rules):
+            by_fruit.setdefault(fruit, []).append((threshold, number))
+
+        self._index = []
+        self._by_fruit = {}
+        self._on_zero = []
+        for fruit, entries in by_fruit.items():
+            entries.sort()
+            thresholds = [threshold for threshold, _ in entries]
+            earliest = list(accumulate((number for _, number in entries), min))
+            self._index.append((earliest[-1], fruit, thresholds, earliest))
+            self._by_fruit[fruit] = (thresholds, earliest)
+            if position := bisect_right(thresholds, 0):
+                self._on_zero.append((earliest[position - 1], fruit))
+        self._index.sort()
+        self._on_zero.sort()
+        self.fruits = [fruit for _, fruit, _, _ in self._index]
+
+    def match(self, fresh_fruit):
+        """Number of the first rule fresh_fruit satisfies, or NO_MATCH."""
+        best = len(self.rules)
+        if len(fresh_fruit) < len(self._index):
+            for number, fruit in self._on_zero:
+                if fruit not in fresh_fruit:
+                    best = number
+                    break
+            by_fruit = self._by_fruit
+            for fruit, count in fresh_fruit.items():
+                if (found := by_fruit.get(fruit)) is None:
+                    continue
+                thresholds, earliest = found
+                position = bisect_right(thresholds, count)
+                if position and earliest[position - 1] < best:
+                    best = earliest[position - 1]
+            return best if best < len(self.rules) else NO_MATCH
+        for first, fruit, thresholds, earliest in self._index:
+            if first >= best:
+                break
+            count = fresh_fruit.get(fruit, 0)
+            position = bisect_right(thresholds, count)
+            if position and earliest[position - 1] < best:
+                best = earliest[position - 1]
+        return best if best < len(self.rules) else NO_MATCH
+
+    def match_many(self, snapshots):
+        if np is not None and self.rules:
+            return self._match_numpy(snapshots).tolist()
+        match = self.match
+        return [match(fresh_fruit) for fresh_fruit in snapshots]
+
+    def _match_numpy(self, snapshots):
+        column = {fruit: i for i, fruit in enumerate(self.fruits)}
+        counts = np.array(
+            [[fresh_fruit.get(fruit, 0) for fruit in self.fruits] for fresh_fruit in snapshots],
+            dtype=float,
+        ).reshape(-1, len(self.fruits))
+        result = np.full(len(counts), NO_MATCH)
+        for number in range(len(self.rules) - 1, -1, -1):
+            fruit, threshold, _ = self.rules[number]
+            result[counts[:, column[fruit]] >= threshold] = number
+        return result
+
+    def apply(self, fresh_fruit):
+        """Run the first matching rule's action on its count, like the cascade."""
+        return self._apply(fresh_fruit, self.match(fresh_fruit))
+
+    def apply_many(self, snapshots):
+        snapshots = list(snapshots)
+        return list(map(self._apply, snapshots, self.match_many(snapshots)))
+
+    def _apply(self, fresh_fruit, number):
+        if number == NO_MATCH:
+            return self.default
+        fruit, _, action = self.rules[number]
+        return action(fresh_fruit.get(fruit, 0))
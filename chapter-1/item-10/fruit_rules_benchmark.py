@@ -0,0 +1,88 @@
+"""
+RuleSet against the if/elif cascade it replaces, over a batch of fresh_fruit dicts.
+
+The 3 rule case is the cascade from prevent_repetition_w_assignment_expr.py, written
+out by hand. The larger cases use generated rules, where the "cascade" is a loop
+testing each rule in order, which is what a long if/elif chain does. For 3 rules
+the hand-written cascade stays faster; the index pays off once there are dozens of
+rules.
+
+    python fruit_rules_benchmark.py             # 100_000 snapshots
+    python fruit_rules_benchmark.py 20000
+"""
+
+import random
+import sys
+from time import perf_counter
+
+from fruit_rules import NO_MATCH, RuleSet, np
+
+FRUIT = [f"fruit{i}" for i in range(60)]
+
+
+def cascade(fresh_fruit):
+    if (count := fresh_fruit.get("banana", 0)) >= 2:
+        return 0
+    elif (count := fresh_fruit.get("apple", 0)) >= 4:
+        return 1
+    elif count := fresh_fruit.get("lemon", 0):
+        return 2
+    else:
+        return NO_MATCH
+
+
+def rule_loop(rules):
+    def match(fresh_fruit):
+        for number, (fruit, threshold, _) in enumerate(rules):
+            if fresh_fruit.get(fruit, 0) >= threshold:
+                return number
+        return NO_MATCH
+
+    return match
+
+
+def random_rules(count, rng):
+    # high thresholds, so a typical snapshot falls through most of the chain
+    return [(rng.choice(FRUIT), rng.randint(5, 40), None) for _ in range(count)]
+
+
+def random_snapshots(fruit, count, rng):
+    return [
+        {name: rng.randint(0, 20) for name in rng.sample(fruit, min(len(fruit), 5))}
+        for _ in range(count)
+    ]
+
+
+def timed(fn, snapshots):
+    start = perf_counter()
+    result = fn(snapshots)
+    return result, perf_counter() - start
+
+
+def compare(label, rules, baseline, snapshots):
+    ruleset = RuleSet(rules)
+    expected, base = timed(lambda batch: list(map(baseline, batch)), snapshots)
+    print(f"{label}: {len(rules)} rules, {len(snapshots):,} snapshots")
+    print(f"{'if/elif cascade':>24}: {base:7.3f} s")
+    found, elapsed = timed(lambda batch: list(map(ruleset.match, batch)), snapshots)
+    assert found == expected
+    print(f"{'RuleSet.match':>24}: {elapsed:7.3f} s  {base / elapsed:5.1f}x")
+    found, elapsed = timed(ruleset.match_many, snapshots)
+    assert found == expected
+    backend = "numpy" if np is not None else "python"
+    print(f"{f'RuleSet.match_many ({backend})':>24}: {elapsed:7.3f} s  {base / elapsed:5.1f}x")
+
+
+def main(count=100_000):
+    rng = random.Random(15)
+    rules = [("banana", 2, None), ("apple", 4, None), ("lemon", 1, None)]
+    snapshots = random_snapshots(["banana", "apple", "lemon", "pear"], count, rng)
+    compare("walrus cascade", rules, cascade, snapshots)
+    for size in (30, 300):
+        rules = random_rules(size, rng)
+        snapshots = random_snapshots(FRUIT, count, rng)
+        compare("generated", rules, rule_loop(rules), snapshots)
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,297 @@
+"""
+dis.dis(f) shows how one function executes. This runs the same disassembly over every
+function in a module and turns it into a JSON report of likely hot spots:
+
+    python hot_paths.py some_module.py                  # static analysis only
+    python hot_paths.py some_module.py --profile        # also run it and time calls
+    python hot_paths.py some_module.py --profile -o report.json -- arg1 arg2
+
+For every code object in the file (module body, functions, methods, lambdas,
+comprehensions) the report has:
+
+    - opcodes: how often each opcode appears
+    - loop_loads: LOAD_ATTR / LOAD_METHOD / LOAD_GLOBAL inside a loop, which run again
+      on every iteration. Binding them to a local before the loop saves the lookup
+    - redundant_lookups: `if key in d: ... d[key]`, which hashes key twice where
+      d.get(key) or try/except KeyError does it once
+
+Loops are found from backward jumps, so the analysis works on the bytecode alone.
+With --profile the module is run as __main__ under sys.setprofile (with its own
+directory on sys.path, so it can import its neighbours), and each function gets its
+call count plus total and self time. A generator or coroutine counts one call each
+time it is resumed, not one per generator created. Functions are then ranked by self
+time, with the number of findings breaking ties, so the findings at the top of the
+list are the ones where time is actually spent.
+"""
+
+import argparse
+import dis
+import json
+import os
+import runpy
+import sys
+from collections import Counter, defaultdict
+from contextlib import redirect_stdout
+from time import perf_counter
+
+JUMPS = set(dis.hasjrel) | set(dis.hasjabs)
+LOOP_LOADS = {"LOAD_ATTR", "LOAD_METHOD", "LOAD_GLOBAL"}
+SIMPLE_LOADS = {
+    "LOAD_FAST": "local",
+    "LOAD_FAST_CHECK": "local",
+    "LOAD_FAST_BORROW": "local",
+    "LOAD_DEREF": "local",
+    "LOAD_NAME": "global",
+    "LOAD_GLOBAL": "global",
+    "LOAD_CONST": "const",
+}
+# 3.13+ fuses two local loads into one instruction
+DOUBLE_LOADS = {"LOAD_FAST_LOAD_FAST", "LOAD_FAST_BORROW_LOAD_FAST_BORROW"}
+
+
+def iter_code(code):
+    """code and every code object nested in it, depth first."""
+    yield code
+    for const in code.co_consts:
+        if hasattr(const, "co_code"):
+            yield from iter_code(const)
+
+
+def code_keys(module):
+    """{id(code): (first line, name, n)} for every code object in a compiled module.
+
+    n numbers the code objects that share a line and a name (two lambdas or two
+    comprehensions on one line), in the same order every time the file is compiled,
+    so keys from analyze_file and from a profiled run of the same file agree.
+    """
+    keys = {}
+    seen = Counter()
+    for code in iter_code(module):
+        base = (code.co_firstlineno, code.co_name)
+        keys[id(code)] = (*base, seen[base])
+        seen[base] += 1
+    return keys
+
+
+def _loops(instructions):
+    """(start, end) offsets of each loop body, from its backward jump."""
+    return [
+        (instr.argval, instr.offset)
+        for instr in instructions
+        if instr.opcode in JUMPS
+        and isinstance(instr.argval, int)
+        and instr.argval < instr.offset
+    ]
+
+
+def _load_tokens(instructions):
+    """Flatten simple loads into (kind, name) tokens, one per pushed value.
+
+    Anything else becomes None, so a pattern never matches across it.
+    """
+    tokens = []
+    for instr in instructions:
+        if instr.opname in DOUBLE_LOADS:
+            tokens.extend((instr.offset, ("local", name)) for name in instr.argval)
+        elif instr.opname in SIMPLE_LOADS:
+            tokens.append((instr.offset, (SIMPLE_LOADS[instr.opname], instr.argval)))
+        else:
+            tokens.append((instr.offset, None))
+    return tokens
+
+
+def _is_subscript(instr):
+    return instr.opname == "BINARY_SUBSCR" or (
+        instr.opname == "BINARY_OP" and instr.argrepr == "[]"
+    )
+
+
+def _redundant_lookups(instructions, lines):
+    tokens = _load_tokens(instructions)
+    # value pushed right before each instruction offset, as token positions
+    position = {offset: i for i, (offset, _) in enumerate(tokens)}
+    found = []
+    for i, instr in enumerate(instructions):
+        if instr.opname != "CONTAINS_OP" or instr.arg != 0:
+            continue
+        at = position[instr.offset]
+        if at < 2 or None in (tokens[at - 2][1], tokens[at - 1][1]):
+            continue
+        key, container = tokens[at - 2][1], tokens[at - 1][1]
+        branch = instructions[i + 1] if i + 1 < len(instructions) else None
+        if branch is None or branch.opcode not in JUMPS:
+            continue
+        body_end = branch.argval
+        for later in instructions[i + 2 :]:
+            if later.offset >= body_end:
+                break
+            if not _is_subscript(later):
+                continue
+            at = position[later.offset]
+            if at >= 2 and (tokens[at - 2][1], tokens[at - 1][1]) == (container, key):
+                found.append(
+                    {
+                        "line": lines[instr.offset],
+                        "container": container[1],
+                        "key": repr(key[1]) if key[0] == "const" else key[1],
+                    }
+                )
+                break
+    return found
+
+
+def analyze_code(code):
+    instructions = list(dis.get_instructions(code))
+    lines = {}
+    line = code.co_firstlineno
+    for instr in instructions:
+        if instr.starts_line:
+            # the line number before 3.13, True (with instr.line_number) after
+            line = instr.line_number if instr.starts_line is True else instr.starts_line
+        lines[instr.offset] = line
+
+    loops = _loops(instructions)
+    loop_loads = {}
+    for instr in instructions:
+        if instr.opname not in LOOP_LOADS:
+            continue
+        depth = sum(start <= instr.offset <= end for start, end in loops)
+        if not depth:
+            continue
+        entry = loop_loads.setdefault(
+            (instr.opname, instr.argval),
+            {"op": instr.opname, "name": instr.argval, "lines": [], "count": 0, "depth": 0},
+        )
+        entry["count"] += 1
+        entry["depth"] = max(entry["depth"], depth)
+        if lines[instr.offset] not in entry["lines"]:
+            entry["lines"].append(lines[instr.offset])
+
+    return {
+        "name": getattr(code, "co_qualname", code.co_name),
+        "line": code.co_firstlineno,
+        "instructions": len(instructions),
+        "loops": len(loops),
+        "opcodes": dict(Counter(instr.opname for instr in instructions).most_common()),
+        "loop_loads": sorted(loop_loads.values(), key=lambda entry: -entry["count"]),
+        "redundant_lookups": _redundant_lookups(instructions, lines),
+    }
+
+
+def analyze_file(path):
+    with open(path, encoding="utf-8") as source:
+        module = compile(source.read(), path, "exec")
+    keys = code_keys(module)
+    return {keys[id(code)]: analyze_code(code) for code in iter_code(module)}
+
+
+def profile_file(path, argv=()):
+    """Run path as __main__ under sys.setprofile, timing every Python function in it.
+
+    Returns ({code_keys() key: {"calls", "total_time", "self_time"}}, error).
+    Times include the profiler's own overhead, so compare them with each other
+    rather than with an unprofiled run.
+    """
+    stats = defaultdict(lambda: {"calls": 0, "total_time": 0.0, "self_time": 0.0})
+    stack = []  # [key, start, time spent in callees]
+    modules = []  # the file's module code, kept alive so its ids in keys stay valid
+    keys = {}
+
+    def profiler(frame, event, arg):
+        if event == "call":
+            code = frame.f_code
+            key = None
+            if code.co_filename == path:
+                if not modules and code.co_name == "<module>":
+                    modules.append(code)
+                    keys.update(code_keys(code))
+                key = keys.get(id(code))
+            stack.append([key, perf_counter(), 0.0])
+        elif event == "return" and stack:
+            key, start, children = stack.pop()
+            elapsed = perf_counter() - start
+            if stack:
+                stack[-1][2] += elapsed
+            if key is not None:
+                entry = stats[key]
+                entry["calls"] += 1
+                entry["total_time"] += elapsed
+                entry["self_time"] += elapsed - children
+
+    saved_argv = sys.argv
+    sys.argv = [path, *argv]
+    directory = os.path.dirname(path)
+    sys.path.insert(0, directory)
+    error = None
+    sys.setprofile(profiler)
+    try:
+        # keep the module's own output out of a report printed to stdout
+        with redirect_stdout(sys.stderr):
+            runpy.run_path(path, run_name="__main__")
+    except SystemExit:
+        pass
+    except Exception as exc:
+        error = f"{type(exc).__name__}: {exc}"
+    finally:
+        sys.setprofile(None)
+        sys.argv = saved_argv
+        sys.path.remove(directory)
+    return dict(stats), error
+
+
+def build_report(path, profile=False, argv=()):
+    path = os.path.abspath(path)
+    functions = analyze_file(path)
+    report = {
+        "file": path,
+        "python": sys.version.split()[0],
+        "profiled": profile,
+    }
+    if profile:
+        stats, error = profile_file(path, argv)
+        report["error"] = error
+        for key, function in functions.items():
+            function.update(stats.get(key, {"calls": 0, "total_time": 0.0, "self_time": 0.0}))
+
+    ranked = sorted(
+        functions.values(),
+        key=lambda function: (
+            -function.get("self_time", 0.0),
+            -(len(function["loop_loads"]) + len(function["redundant_lookups"])),
+            function["line"],
+        ),
+    )
+    for rank, function in enumerate(ranked, 1):
+        function["rank"] = rank
+
+    opcodes = Counter()
+    for function in ranked:
+        opcodes.update(function["opcodes"])
+    report["opcodes"] = dict(opcodes.most_common())
+    report["findings"] = {
+        "loop_loads": sum(len(function["loop_loads"]) for function in ranked),
+        "redundant_lookups": sum(len(function["redundant_lookups"]) for function in ranked),
+    }
+    report["functions"] = ranked
+    return report
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("path", help="Python file to analyze")
+    parser.add_argument("argv", nargs="*", help="arguments for the file when profiling")
+    parser.add_argument("--profile", action="store_true", help="run the file and time calls")
+    parser.add_argument("-o", "--output", help="write the report here instead of stdout")
+    options = parser.parse_args(args)
+
+    report = build_report(options.path, options.profile, options.argv)
+    text = json.dumps(report, indent=2)
+    if options.output:
+        with open(options.output, "w", encoding="utf-8") as out:
+            out.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+Producer/consumer version of the while fresh_fruit := pick_fruit() loop.
+
+The loop in prevent_repetition_w_assignment_expr.py waits for each make_juice call
+before it asks for the next delivery. JuicePipeline hands make_juice to a pool of
+workers, so the next pick_fruit call overlaps with the juicing of earlier batches.
+pick_fruit itself is not a separate stage: it is called in the thread that iterates
+the pipeline, between submitting batches and handing back bottles.
+
+    - each delivery is split into (fruit, count) orders, grouped into batches of
+      batch_size
+    - at most max_pending batches (default 2 * workers) can be waiting for a
+      worker. When the pool falls behind, the iterating thread waits for the
+      oldest batch before it calls pick_fruit again, instead of queueing
+      deliveries without limit (backpressure)
+    - mode="thread" for make_juice calls that wait on I/O, mode="process" for CPU
+      bound ones. Process mode pickles make_juice, so it has to be a module-level
+      function
+    - bottles come back in delivery order, like bottles.extend in the loop
+
+After a run, pipeline.stats has bottles/sec, queue depths and worker utilization.
+"""
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from time import perf_counter
+
+EXECUTORS = {"thread": ThreadPoolExecutor, "process": ProcessPoolExecutor}
+
+
+def juice_batch(make_juice, batch):
+    """Run one batch of orders, returning (bottles, seconds spent working)."""
+    start = perf_counter()
+    bottles = []
+    for fruit, count in batch:
+        bottles.extend(make_juice(fruit, count))
+    return bottles, perf_counter() - start
+
+
+class PipelineStats:
+    def __init__(self, workers):
+        self.workers = workers
+        self.bottles = 0
+        self.deliveries = 0
+        self.batches = 0
+        self.elapsed = 0.0
+        self.busy = 0.0
+        self.depths = []
+
+    @property
+    def bottles_per_sec(self):
+        return self.bottles / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def utilization(self):
+        """Fraction of the run the workers spent inside make_juice."""
+        if not self.elapsed:
+            return 0.0
+        return self.busy / (self.workers * self.elapsed)
+
+    @property
+    def mean_depth(self):
+        return sum(self.depths) / len(self.depths) if self.depths else 0.0
+
+    @property
+    def max_depth(self):
+        return max(self.depths, default=0)
+
+    def __repr__(self):
+        return (
+            f"PipelineStats(bottles={self.bottles}, deliveries={self.deliveries}, "
+            f"batches={self.batches}, bottles/sec={self.bottles_per_sec:,.0f}, "
+            f"queue depth mean={self.mean_depth:.1f} max={self.max_depth}, "
+            f"utilization={self.utilization:.0%})"
+        )
+
+
+class JuicePipeline:
+    def __init__(
+        self,
+        pick_fruit,
+        make_juice,
+        workers=4,
+        mode="thread",
+        batch_size=16,
+        max_pending=None,
+    ):
+        if mode not in EXECUTORS:
+            raise ValueError(f"mode must be one of {sorted(EXECUTORS)}, not {mode!r}")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.pick_fruit = pick_fruit
+        self.make_juice = make_juice
+        self.workers = workers
+        self.mode = mode
+        self.batch_size = batch_size
+        if max_pending is None:
+            max_pending = 2 * workers
+        elif max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+        self.max_pending = max_pending
+        self.stats = PipelineStats(workers)
+
+    def _batches(self):
+        batch = []
+        while fresh_fruit := self.pick_fruit():
+            self.stats.deliveries += 1
+            for order in fresh_fruit.items():
+                batch.append(order)
+                if len(batch) == self.batch_size:
+                    yield batch
+                    batch = []
+        if batch:
+            yield batch
+
+    def __iter__(self):
+        """Yield each batch's bottles, in order, as soon as it is done."""
+        stats = self.stats = PipelineStats(self.workers)
+        start = perf_counter()
+        pending = deque()
+
+        def collect():
+            bottles, busy = pending.popleft().result()
+            stats.bottles += len(bottles)
+            stats.busy += busy
+            return bottles
+
+        with EXECUTORS[self.mode](max_workers=self.workers) as pool:
+            try:
+                for batch in self._batches():
+                    if len(pending) >= self.max_pending:
+                        yield collect()  # backpressure: wait for the oldest batch
+                    stats.depths.append(len(pending))
+                    pending.append(pool.submit(juice_batch, self.make_juice, batch))
+                    stats.batches += 1
+                while pending:
+                    yield collect()
+            finally:
+                for future in pending:
+                    future.cancel()
+                stats.elapsed = perf_counter() - start
+
+    def run(self):
+        """Drain the pipeline and return every bottle, like the bottles list."""
+        bottles = []
+        for batch in self:
+            bottles.extend(batch)
+        return bottles
@@ -0,0 +1,67 @@
+"""
+Serial walrus loop versus JuicePipeline, with simulated I/O-bound (sleep) and
+CPU-bound (arithmetic) make_juice, for a few worker counts and batch sizes.
+
+    python juice_pipeline_benchmark.py           # 2000 deliveries
+    python juice_pipeline_benchmark.py 200
+"""
+
+import os
+import sys
+from time import perf_counter, sleep
+
+from juice_pipeline import JuicePipeline
+
+FRUIT = ("apple", "banana", "lemon", "orange")
+
+
+def make_picker(deliveries):
+    orders = iter([{fruit: 1 + (i + j) % 3 for j, fruit in enumerate(FRUIT)} for i in range(deliveries)])
+    return lambda: next(orders, None)
+
+
+def io_juice(fruit, count):
+    sleep(0.0005)  # a remote call
+    return [fruit] * count
+
+
+def cpu_juice(fruit, count):
+    total = 0
+    for i in range(20_000):
+        total += i * i
+    return [fruit] * count
+
+
+def serial(deliveries, make_juice):
+    pick_fruit = make_picker(deliveries)
+    bottles = []
+    start = perf_counter()
+    while fresh_fruit := pick_fruit():
+        for fruit, count in fresh_fruit.items():
+            bottles.extend(make_juice(fruit, count))
+    return len(bottles), perf_counter() - start
+
+
+def main(deliveries=2_000):
+    cpus = os.cpu_count() or 1
+    print(f"{deliveries} deliveries, {cpus} CPUs")
+    for label, make_juice, mode in (("io", io_juice, "thread"), ("cpu", cpu_juice, "process")):
+        bottles, elapsed = serial(deliveries, make_juice)
+        print(f"{label:>4} {'serial loop':>24}: {bottles / elapsed:>10,.0f} bottles/s")
+        for workers in (4, 16) if mode == "thread" else (cpus, 2 * cpus):
+            for batch_size in (1, 16):
+                pipeline = JuicePipeline(
+                    make_picker(deliveries), make_juice, workers=workers, mode=mode, batch_size=batch_size
+                )
+                assert len(pipeline.run()) == bottles
+                stats = pipeline.stats
+                name = f"{mode} x{workers} batch={batch_size}"
+                print(
+                    f"{label:>4} {name:>24}: {stats.bottles_per_sec:>10,.0f} bottles/s  "
+                    f"depth {stats.mean_depth:4.1f}/{stats.max_depth:<3} "
+                    f"utilization {stats.utilization:4.0%}"
+                )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -31,6 +31,10 @@ def f():
 
 dis.dis(f)
 
+# hot_paths.py runs the same disassembly over a whole module and reports opcode counts,
+# attribute/global loads inside loops and `if k in d: d[k]` double lookups as JSON:
+#   python hot_paths.py prevent_repetition_w_assignment_expr.py --profile
+
 
 fresh_fruit = {
     "apple": 10,
@@ -166,6 +170,20 @@ elif count := fresh_fruit.get("lemon", 0):
 else:
     to_enjoy = "nothing"
 
+# with many fruits and thresholds, or many fresh_fruit dicts to decide at once,
+# fruit_rules.py compiles the cascade into an index. See fruit_rules_benchmark.py
+from fruit_rules import RuleSet
+
+rules = RuleSet(
+    [
+        ("banana", 2, lambda count: make_smoothies(slice_bananas(count))),
+        ("apple", 4, make_cider),
+        ("lemon", 1, make_lemonade),
+    ]
+)
+to_enjoy = rules.apply(fresh_fruit)
+print(rules.match_many([{"banana": 1, "apple": 5}, {"lemon": 3}, {}]))  # [1, 2, -1]
+
 
 """
 Another common frustration of new Python programmers is the lack of a do/while
@@ -215,6 +233,43 @@ while fresh_fruit := pick_fruit():
     for fruit, count in fresh_fruit.items():
         batch = make_juice(fruit, count)
         bottles.extend(batch)
+
+"""
+That loop still waits for every make_juice before picking more fruit. juice_pipeline.py
+puts bounded queues between pick_fruit and a pool of make_juice workers (threads for
+I/O-bound work, processes for CPU-bound), with batching, backpressure and stats.
+See juice_pipeline_benchmark.py
+"""
+from juice_pipeline import JuicePipeline
+
+deliveries = iter([{"apple": 2, "lemon": 1}, {"banana": 3}])
+pipeline = JuicePipeline(lambda: next(deliveries, None), lambda fruit, count: [fruit] * count)
+bottles = pipeline.run()
+print(bottles, pipeline.stats)
+
+# when pick_fruit polls the network and make_juice calls remote services, async_juice
+# overlaps them with asyncio and streams bottles to the consumer instead of building a
+# list. See async_juice_benchmark.py
+import asyncio
+
+from async_juice import juice_stream
+
+
+async def juice_demo():
+    deliveries = iter([{"apple": 2}, {"lemon": 1}])
+
+    async def pick_fruit():
+        return next(deliveries, None)
+
+    async def make_juice(fruit, count):
+        return [fruit] * count
+
+    async for bottle in juice_stream(pick_fruit, make_juice, max_in_flight=8):
+        print("bottled", bottle)
+
+
+asyncio.run(juice_demo())
+
 """
 - assignment expression use the walrus operator to both assign and evaluate variable
 names in a single expression, thus reducing repetition
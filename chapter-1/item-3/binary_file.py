@@ -0,0 +1,120 @@
+"""
+Reading big binary files without f.read() pulling the whole thing into memory.
+
+Both readers share one interface:
+
+    len(reader)          size of the file in bytes
+    reader[start:stop]   a slice of the file
+    reader.chunks(size)  memoryviews over consecutive pieces of the file
+
+    - MappedFile memory-maps the file. Slices and chunks are memoryviews straight
+      into the mapping, so nothing is copied and the OS pages data in on demand.
+      Release any views you keep before calling close(), mmap can't be closed
+      while they exist.
+    - ChunkedFile reads with readinto into one preallocated bytearray that is reused
+      for every chunk, so a sequential scan allocates nothing per chunk. Each chunk
+      is only valid until the next one is read. Slices are read from disk into a
+      fresh buffer, and can be taken in the middle of a chunks() scan.
+"""
+
+import mmap
+import os
+from abc import ABC, abstractmethod
+
+CHUNK_SIZE = 1 << 20
+
+
+class BinaryReader(ABC):
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        self._size = os.fstat(self._file.fileno()).st_size
+
+    def __len__(self):
+        return self._size
+
+    @abstractmethod
+    def __getitem__(self, index):
+        pass
+
+    @abstractmethod
+    def chunks(self, size=CHUNK_SIZE):
+        pass
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class MappedFile(BinaryReader):
+    def __init__(self, path):
+        super().__init__(path)
+        if self._size:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._view = memoryview(self._map)
+        else:
+            # mmap refuses empty files
+            self._map = None
+            self._view = memoryview(b"")
+
+    def __getitem__(self, index):
+        return self._view[index]
+
+    def chunks(self, size=CHUNK_SIZE):
+        view = self._view
+        for start in range(0, self._size, size):
+            yield view[start : start + size]
+
+    def close(self):
+        try:
+            self._view.release()
+            if self._map is not None:
+                self._map.close()  # BufferError while views into it are still alive
+        finally:
+            super().close()
+
+
+class ChunkedFile(BinaryReader):
+    def __init__(self, path, chunk_size=CHUNK_SIZE):
+        super().__init__(path)
+        self._buffer = bytearray(chunk_size)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            positions = range(*index.indices(self._size))
+            if not positions:
+                return memoryview(b"")
+            # read the span once, lowest position to highest, then stride over it
+            low = min(positions[0], positions[-1])
+            buffer = bytearray(abs(positions[-1] - positions[0]) + 1)
+            self._file.seek(low)
+            self._file.readinto(buffer)
+            return memoryview(buffer)[positions[0] - low :: positions.step]
+
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("file index out of range")
+        self._file.seek(index)
+        return self._file.read(1)[0]
+
+    def chunks(self, size=None):
+        if size is not None and size != len(self._buffer):
+            self._buffer = bytearray(size)
+        view = memoryview(self._buffer)
+        seek = self._file.seek
+        readinto = self._file.readinto
+        # the offset lives here, not in the shared file position, so indexing or
+        # slicing the file between chunks can't move the scan
+        offset = 0
+        while True:
+            seek(offset)
+            count = readinto(view)
+            if not count:
+                return
+            offset += count
+            yield view[:count]
@@ -0,0 +1,94 @@
+"""
+Time and peak RSS of checksumming a large binary file three ways:
+
+    - read: with open(path, "rb") as f: data = f.read(), like section 6 of
+      bytes_vs_str.py
+    - mmap: MappedFile chunks
+    - readinto: ChunkedFile with one reused buffer
+
+Each approach runs in its own child process so ru_maxrss is not shared between
+them. Pages of a memory-mapped file count towards RSS once touched, but they are
+clean page cache the OS can drop at any time, unlike the heap copy from f.read().
+
+    python binary_file_benchmark.py          # 512 MiB file
+    python binary_file_benchmark.py 64       # 64 MiB file
+"""
+
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import zlib
+from time import perf_counter
+
+from binary_file import ChunkedFile, MappedFile
+
+
+def checksum_read(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    return zlib.crc32(data)
+
+
+def checksum_chunks(reader_cls, path):
+    crc = 0
+    with reader_cls(path) as reader:
+        for chunk in reader.chunks():
+            crc = zlib.crc32(chunk, crc)
+            del chunk  # MappedFile can't close while a view into it is alive
+    return crc
+
+
+APPROACHES = {
+    "read": checksum_read,
+    "mmap": lambda path: checksum_chunks(MappedFile, path),
+    "readinto": lambda path: checksum_chunks(ChunkedFile, path),
+}
+
+
+def run_child(name, path):
+    start = perf_counter()
+    crc = APPROACHES[name](path)
+    elapsed = perf_counter() - start
+    peak_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(crc, elapsed, peak_kib)
+
+
+def write_file(path, mebibytes):
+    block = os.urandom(1 << 20)
+    with open(path, "wb") as f:
+        for _ in range(mebibytes):
+            f.write(block)
+
+
+def main(mebibytes=512):
+    path = os.path.join(tempfile.mkdtemp(), "data.bin")
+    write_file(path, mebibytes)
+    try:
+        print(f"{mebibytes} MiB file")
+        print(f"{'approach':>10} {'time s':>8} {'MB/s':>8} {'peak RSS MiB':>13}")
+        checksums = set()
+        for name in APPROACHES:
+            output = subprocess.run(
+                [sys.executable, __file__, "--child", name, path],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            crc, elapsed, peak_kib = output.split()
+            checksums.add(crc)
+            elapsed = float(elapsed)
+            rate = mebibytes * 2**20 / elapsed / 1e6
+            print(f"{name:>10} {elapsed:>8.3f} {rate:>8.0f} {int(peak_kib) / 1024:>13.1f}")
+        assert len(checksums) == 1
+    finally:
+        os.remove(path)
+        os.rmdir(os.path.dirname(path))
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--child"]:
+        run_child(*sys.argv[2:])
+    else:
+        main(*map(int, sys.argv[1:]))
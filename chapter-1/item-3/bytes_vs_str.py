@@ -35,6 +35,16 @@ foo = b"foo"
 print(f"to_str: {repr(to_str(foo))} | {repr(to_str('bar'))}")
 print(f"to_bytes: {repr(to_bytes(b'foo'))} | {repr(to_bytes('bar'))}")
 
+# conversion.py has versions of these for big payloads: they accept memoryview and
+# bytearray without copying, decode chunked streams incrementally and convert
+# whole lists at once (see conversion_benchmark.py)
+from conversion import decode_chunks, to_str_batch
+
+snowman = "a\u2603b".encode("utf-8")  # the snowman is 3 bytes
+chunks = [snowman[:2], snowman[2:]]  # split mid-character
+print(f"chunked: {''.join(decode_chunks(chunks))!r}")
+print(f"batch: {to_str_batch([b'foo', memoryview(b'bar'), 'baz'])}")
+
 print("\n" + "=" * 40)
 print("3. Concatenation")
 print("=" * 40)
@@ -91,3 +101,14 @@ except Exception as e:
 with open("data.bin", "rb") as f:
     data = f.read()
     print("binary mode works:", data)
+
+# f.read() loads the whole file into memory. binary_file.py has two readers for big
+# files with the same interface: MappedFile (mmap, zero-copy slices) and ChunkedFile
+# (readinto one reused buffer). See binary_file_benchmark.py
+from binary_file import ChunkedFile, MappedFile
+
+with MappedFile("data.bin") as f:
+    print("mmap slice:", bytes(f[1:3]), "size:", len(f))
+
+with ChunkedFile("data.bin", chunk_size=2) as f:
+    print("chunks:", [bytes(chunk) for chunk in f.chunks()])
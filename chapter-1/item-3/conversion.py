@@ -0,0 +1,83 @@
+"""
+to_str / to_bytes for big payloads.
+
+    - to_str and to_bytes take any bytes-like object (bytes, bytearray,
+      memoryview, array...). str(buffer, encoding) decodes straight from the
+      buffer, so a memoryview slice of a large payload is never copied into a
+      temporary bytes object first.
+    - StreamDecoder wraps a codecs incremental decoder for chunked streams. A
+      multibyte UTF-8 character split across two chunks is held back until the
+      rest of it arrives, where decoding each chunk on its own would raise
+      UnicodeDecodeError.
+    - to_str_batch / to_bytes_batch convert a whole list in one call.
+"""
+
+import codecs
+
+
+def to_str(bytes_or_str, encoding="utf-8", errors="strict"):
+    if isinstance(bytes_or_str, str):
+        return bytes_or_str
+    if isinstance(bytes_or_str, (bytes, bytearray)):
+        return bytes_or_str.decode(encoding, errors)
+    # memoryview and other buffers decode in place, without a bytes() copy
+    return str(bytes_or_str, encoding, errors)
+
+
+def to_bytes(bytes_or_str, encoding="utf-8", errors="strict"):
+    """Encode str. Bytes-like values come back as they are, without a copy."""
+    if isinstance(bytes_or_str, str):
+        return bytes_or_str.encode(encoding, errors)
+    return bytes_or_str
+
+
+def to_str_batch(values, encoding="utf-8", errors="strict"):
+    # inline the common bytes case instead of paying a to_str call per value
+    return [
+        value.decode(encoding, errors)
+        if isinstance(value, bytes)
+        else to_str(value, encoding, errors)
+        for value in values
+    ]
+
+
+def to_bytes_batch(values, encoding="utf-8", errors="strict"):
+    return [
+        value.encode(encoding, errors) if isinstance(value, str) else value
+        for value in values
+    ]
+
+
+class StreamDecoder:
+    """Decode a byte stream that arrives in arbitrary chunks."""
+
+    def __init__(self, encoding="utf-8", errors="strict"):
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors)
+
+    def feed(self, chunk):
+        """Decode as much of chunk as possible, keeping any partial character."""
+        return self._decoder.decode(chunk)
+
+    def finish(self):
+        """Flush the stream. Raises UnicodeDecodeError if it ended mid-character."""
+        return self._decoder.decode(b"", final=True)
+
+    def reset(self):
+        self._decoder.reset()
+
+
+def decode_chunks(chunks, encoding="utf-8", errors="strict"):
+    """Yield decoded text for each chunk of an iterable of bytes-like chunks."""
+    decoder = StreamDecoder(encoding, errors)
+    for chunk in chunks:
+        if text := decoder.feed(chunk):
+            yield text
+    if text := decoder.finish():
+        yield text
+
+
+def iter_chunks(buffer, size):
+    """Zero-copy memoryview slices of size bytes over a bytes-like buffer."""
+    view = memoryview(buffer)
+    for start in range(0, len(view), size):
+        yield view[start : start + size]
@@ -0,0 +1,73 @@
+"""
+Decode throughput in MB/s on ASCII-heavy and multibyte-heavy UTF-8 payloads.
+
+    - whole: the original to_str on one big bytes object
+    - memoryview: conversion.to_str on a memoryview, no bytes copy
+    - chunked: StreamDecoder over 64 KiB memoryview slices
+    - per-chunk copy: bytes(chunk).decode() for each slice, the naive way, which
+      only works when no character straddles a chunk boundary
+    - batch: many small values, original to_str in a loop vs to_str_batch
+
+    python conversion_benchmark.py           # 64 MB payloads
+    python conversion_benchmark.py 8         # 8 MB payloads
+"""
+
+import sys
+from collections import deque
+from time import perf_counter
+
+from conversion import decode_chunks, iter_chunks, to_str, to_str_batch
+
+CHUNK = 64 * 1024
+
+
+def original_to_str(bytes_or_str):
+    if isinstance(bytes_or_str, bytes):
+        value = bytes_or_str.decode("utf-8")
+    else:
+        value = bytes_or_str
+    return value
+
+
+def payload(sample, megabytes):
+    unit = sample.encode("utf-8")
+    return unit * (megabytes * 2**20 // len(unit))
+
+
+def rate(fn, size):
+    start = perf_counter()
+    fn()
+    return size / (perf_counter() - start) / 1e6
+
+
+def main(megabytes=64):
+    samples = {
+        "ascii": "the quick brown fox jumps over the lazy dog 0123456789\n",
+        "multibyte": "無為自然 Ünïcödé текст 😀 ελληνικά\n",
+    }
+    print(f"{'data':>10} {'approach':>16} {'MB/s':>10}")
+    for label, sample in samples.items():
+        data = payload(sample, megabytes)
+        size = len(data)
+        view = memoryview(data)
+
+        def per_chunk_copy():
+            for chunk in iter_chunks(view, CHUNK):
+                bytes(chunk).decode("utf-8", "replace")
+
+        small = data[: 2**24].splitlines()
+        small_size = sum(map(len, small))
+        cases = [
+            ("whole", lambda: original_to_str(data), size),
+            ("memoryview", lambda: to_str(view), size),
+            ("chunked", lambda: deque(decode_chunks(iter_chunks(view, CHUNK)), 0), size),
+            ("per-chunk copy", per_chunk_copy, size),
+            ("loop to_str", lambda: [original_to_str(v) for v in small], small_size),
+            ("to_str_batch", lambda: to_str_batch(small), small_size),
+        ]
+        for name, fn, nbytes in cases:
+            print(f"{label:>10} {name:>16} {rate(fn, nbytes):>10.0f}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
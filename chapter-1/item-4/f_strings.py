@@ -76,6 +76,17 @@ template = (
 formatted = template % menu
 print(formatted)
 
+# when templates only arrive at runtime (so no f-strings) and get rendered millions of
+# times, templates.py caches each template and renders whole batches in one call.
+# Named templates like the menu are compiled into f-string functions.
+# See templates_benchmark.py
+from templates import compile_template
+
+menu_template = compile_template(template)
+assert menu_template.render(menu) == formatted
+rows = [(i + 1, item.title(), count) for i, (item, count) in enumerate(pantry)]
+print(compile_template("#%d: %-10s = %.2f").render_many(rows))
+
 # Python 3 added support for advanced string formatting that is more
 # expressive than the old C-style format strings that use the % operator
 # Accessed through the built in format function
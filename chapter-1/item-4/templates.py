@@ -0,0 +1,242 @@
+"""
+Cached templates for rendering lots of lines from format strings that only show up
+at runtime, where an f-string can't be written in advance.
+
+    tmpl = compile_template("#%d: %-10s = %.2f")
+    tmpl.render(1, "Raisins", 1.25)
+    tmpl.render_many(rows)  # one call for a whole batch
+
+compile_template looks at a template once and keeps the result in an LRU cache
+keyed by the template text. Both mini-languages from f_strings.py are supported.
+A template with {} fields is taken as str.format, anything else as %; pass
+style="%" for a % template that also has literal {} in it.
+
+    - named fields (%(soup)s, {soup}): the template is compiled into an f-string
+      function. This is where the time goes with % and str.format, since every call
+      parses the template and looks each key up through the format machinery.
+    - positional fields (%d, {}, {0}): parsing these in C is cheaper than calling
+      any Python function per line, so the batch is rendered by mapping the
+      template's own bound % / str.format method over the rows, all in C. % rows
+      must be tuples, exactly like template % row.
+
+Only names generated by the parser go into compiled source. Literal text, keys and
+format specs are passed in as constants, so the template text is never evaluated
+as code. Compiled %(name)d and %(name)f convert with int() and float(), so unlike
+% they also accept numeric strings such as "5". Named templates the compiler
+doesn't handle (* widths, %c, {name.attr}, nested specs, ...) fall back to the
+plain % / str.format call.
+"""
+
+import re
+from functools import lru_cache
+from itertools import starmap
+from operator import index
+from string import Formatter
+
+TEMPLATE_CACHE_SIZE = 256
+
+PERCENT_SPEC = re.compile(
+    r"%(?:\((?P<key>[^)]*)\))?"
+    r"(?P<flags>[#0\- +]*)"
+    r"(?P<width>\*|\d+)?"
+    r"(?:\.(?P<precision>\*|\d+))?"
+    r"[hlL]?"
+    r"(?P<type>[diouxXeEfFgGcrsa%])"
+)
+
+# % conversion -> (function applied to the value, str.format type)
+PERCENT_TYPES = {
+    "d": ("int", "d"),
+    "i": ("int", "d"),
+    "u": ("int", "d"),
+    "o": ("index", "o"),
+    "x": ("index", "x"),
+    "X": ("index", "X"),
+    "e": ("float", "e"),
+    "E": ("float", "E"),
+    "f": ("float", "f"),
+    "F": ("float", "F"),
+    "g": ("float", "g"),
+    "G": ("float", "G"),
+    "s": ("str", ""),
+    "r": ("repr", ""),
+    "a": ("ascii", ""),
+}
+
+
+class Unsupported(Exception):
+    pass
+
+
+class Template:
+    __slots__ = ("text", "style", "named", "compiled", "_fn", "_many")
+
+    def __init__(self, text, style, named, compiled, fn, many):
+        self.text = text
+        self.style = style
+        self.named = named
+        self.compiled = compiled
+        self._fn = fn
+        self._many = many
+
+    def render(self, *args, **kwargs):
+        """Same result as text % args (or text % mapping) / text.format(...)."""
+        if self.named:
+            return self._fn(args[0] if args else kwargs)
+        if self.style == "%":
+            return self._fn(args)
+        return self._fn(*args, **kwargs)
+
+    def render_many(self, rows):
+        """Render a batch: tuples for positional templates, mappings for named ones."""
+        return list(self._many(self._fn, rows))
+
+    def __repr__(self):
+        return f"Template({self.text!r}, style={self.style!r}, compiled={self.compiled})"
+
+
+class _Builder:
+    """Collects f-string source, with everything from the template as constants."""
+
+    def __init__(self):
+        self.parts = []
+        self.constants = {"index": index}
+
+    def constant(self, value):
+        name = f"c{len(self.constants)}"
+        self.constants[name] = value
+        return name
+
+    def literal(self, text):
+        if text:
+            self.parts.append("{%s}" % self.constant(text))
+
+    def field(self, key, convert=None, conversion=None, spec=""):
+        expr = "m[%s]" % self.constant(key)
+        if convert:
+            expr = f"{convert}({expr})"
+        if conversion:
+            expr += "!" + conversion
+        if spec:
+            expr += ":{%s}" % self.constant(spec)
+        self.parts.append("{%s}" % expr)
+
+    def build(self):
+        return eval("lambda m: f'%s'" % "".join(self.parts), self.constants)
+
+
+def _percent_spec(match):
+    flags = match["flags"]
+    convert, kind = PERCENT_TYPES[match["type"]]
+    spec = ""
+    if "-" in flags:
+        spec += "<"
+    elif kind == "" and match["width"]:
+        spec += ">"  # % right-aligns strings, format left-aligns them
+    if kind:
+        if "+" in flags:
+            spec += "+"
+        elif " " in flags:
+            spec += " "
+        if "#" in flags and kind != "d":
+            spec += "#"
+        if "0" in flags and "-" not in flags:
+            spec += "0"
+    spec += match["width"] or ""
+    if match["precision"] is not None:
+        spec += "." + match["precision"]
+    return convert, spec + kind
+
+
+def _compile_percent(text):
+    builder = _Builder()
+    position = 0
+    for match in PERCENT_SPEC.finditer(text):
+        literal = text[position : match.start()]
+        if "%" in literal:
+            raise Unsupported("stray %")
+        builder.literal(literal)
+        position = match.end()
+
+        if match["type"] == "%":
+            builder.literal("%")
+            continue
+        if match["key"] is None:
+            raise Unsupported("positional field in a named template")
+        if match["type"] == "c" or "*" in (match["width"], match["precision"]):
+            raise Unsupported(match.group())
+        if match["precision"] is not None and match["type"] in "diuoxX":
+            # for integers % reads precision as a minimum number of digits
+            raise Unsupported(match.group())
+
+        convert, spec = _percent_spec(match)
+        builder.field(match["key"], convert, None, spec)
+
+    tail = text[position:]
+    if "%" in tail:
+        raise Unsupported("stray %")
+    builder.literal(tail)
+    return builder.build()
+
+
+def _compile_format(text):
+    builder = _Builder()
+    for literal, field, spec, conversion in Formatter().parse(text):
+        builder.literal(literal)
+        if field is None:
+            continue
+        if not field or field.isdecimal() or "." in field or "[" in field or "{" in spec:
+            raise Unsupported(field)
+        if conversion not in (None, "r", "s", "a"):
+            raise Unsupported(f"conversion !{conversion}")  # str.format raises the ValueError
+        builder.field(field, None, conversion, spec)
+    return builder.build()
+
+
+def _fields(text, style):
+    """(has named fields, has positional fields)"""
+    if style == "%":
+        keys = [m["key"] for m in PERCENT_SPEC.finditer(text) if m["type"] != "%"]
+    else:
+        keys = [field for _, field, _, _ in Formatter().parse(text) if field is not None]
+        keys = [None if not key or key[0].isdecimal() else key for key in keys]
+    return any(key is not None for key in keys), any(key is None for key in keys)
+
+
+def detect_style(text):
+    """The style to use for text: "{" if it has str.format fields, otherwise "%"."""
+    try:
+        if any(field is not None for _, field, _, _ in Formatter().parse(text)):
+            return "{"
+    except ValueError:
+        pass  # unbalanced braces: not a str.format template
+    return "%"
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def compile_template(text, style=None):
+    """Prepare text for rendering; style is "%" or "{", detected if omitted."""
+    style = style or detect_style(text)
+    if style not in ("%", "{"):
+        raise ValueError(f"unknown template style: {style!r}")
+
+    named, positional = _fields(text, style)
+    if named and not positional:
+        try:
+            fn = _compile_percent(text) if style == "%" else _compile_format(text)
+            return Template(text, style, True, True, fn, map)
+        except Unsupported:
+            fn = text.__mod__ if style == "%" else text.format_map
+            return Template(text, style, True, False, fn, map)
+
+    if style == "%":
+        return Template(text, style, False, False, text.__mod__, map)
+    return Template(text, style, False, False, text.format, starmap)
+
+
+def render(text, *args, **kwargs):
+    return compile_template(text).render(*args, **kwargs)
+
+
+def render_many(text, rows):
+    return compile_template(text).render_many(rows)
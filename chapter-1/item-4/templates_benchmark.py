@@ -0,0 +1,59 @@
+"""
+Render the pantry rows and the menu template from f_strings.py many times, inline
+(%, str.format and f-strings, as written in that file) versus compiled templates.
+
+    python templates_benchmark.py            # 10^6 rows
+    python templates_benchmark.py 100000
+"""
+
+import random
+import sys
+from time import perf_counter
+
+from templates import compile_template
+
+ROW = "#%d: %-10s = %.2f"
+ROW_FORMAT = "#{}: {:<10s} = {:.2f}"
+MENU = (
+    "Today's soup is %(soup)s, "
+    "buy one get two %(oyster)s oysters, "
+    "and our special entree is %(special)s"
+)
+
+
+def timed(fn):
+    start = perf_counter()
+    result = fn()
+    return result, perf_counter() - start
+
+
+def main(size=1_000_000):
+    items = ["raisins", "bananas", "cherries", "apples", "figs"]
+    rows = [(i + 1, random.choice(items).title(), random.random() * 100) for i in range(size)]
+    menus = [
+        {"soup": random.choice(items), "oyster": "kumamoto", "special": "schnitzel"}
+        for _ in range(size)
+    ]
+    row_template = compile_template(ROW)
+    row_format_template = compile_template(ROW_FORMAT)
+    menu_template = compile_template(MENU)
+
+    cases = [
+        ("rows", "inline %", lambda: [ROW % row for row in rows]),
+        ("rows", "inline .format", lambda: [ROW_FORMAT.format(*row) for row in rows]),
+        ("rows", "inline f-string", lambda: [f"#{i}: {item:<10s} = {count:.2f}" for i, item, count in rows]),
+        ("rows", "render_many %", lambda: row_template.render_many(rows)),
+        ("rows", "render_many {}", lambda: row_format_template.render_many(rows)),
+        ("menu", "inline % dict", lambda: [MENU % menu for menu in menus]),
+        ("menu", "render_many", lambda: menu_template.render_many(menus)),
+    ]
+    print(f"{size} lines")
+    expected = {}
+    for label, name, fn in cases:
+        lines, elapsed = timed(fn)
+        assert expected.setdefault(label, lines) == lines
+        print(f"{label:>5} {name:>16}: {elapsed:7.3f} s  {size / elapsed:12,.0f} lines/s")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -39,6 +39,14 @@ def get_first_int(values, key, default=0):
 green = get_first_int(my_values, "green")
 print(green)
 
+# for hot paths, query.QuerySchema declares the typed fields (with defaults like
+# get_first_int's) and pulls them straight out of the raw query string in one pass,
+# with no dict of lists in between. See query_benchmark.py
+from query import QuerySchema
+
+colors = QuerySchema(red=int, green=int, opacity=int)
+print(colors.parse("red=5&blue=0&green="))  # {'red': 5, 'green': 0, 'opacity': 0}
+
 
 """
 - Python's syntax makes it easy to write single-line expressions that
@@ -46,3 +54,13 @@ print(green)
 - Move these expressions into helpers and consider if/else as an alternative
   to Boolean operators or and and in expression
 """
+
+# when the same few query strings come in over and over, parse each one once.
+# query_cache.CachedQueryParser keeps a bounded LRU/LFU cache of read-only results,
+# counts hits/misses/evictions and is safe to share between threads
+from query_cache import CachedQueryParser
+
+parser = CachedQueryParser(colors, maxsize=1024, policy="lfu")
+for _ in range(3):
+    green = parser.get_first_int("red=5&blue=0&green=", "green")
+print(green, parser.stats())
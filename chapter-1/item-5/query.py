@@ -0,0 +1,89 @@
+"""
+Single-pass typed extraction from raw query strings.
+
+parse_qs builds a dict of lists for every key in the query string, and then
+get_first_int does a [""] default lookup per key we actually want. QuerySchema
+declares the wanted fields up front and pulls them straight out of the raw
+string, in one pass, with the same rules as parse_qs(..., keep_blank_values=True)
+followed by get_first_int:
+
+    - the first occurrence of a key wins
+    - a missing or blank value gives the field's default
+    - keys and values are only unquoted when they contain % or +
+    - a value that doesn't convert raises ValueError, like int() in get_first_int
+
+    schema = QuerySchema(red=int, green=int, opacity=(float, 1.0))
+    schema.parse("red=5&blue=0&green=")    # {'red': 5, 'green': 0, 'opacity': 1.0}
+    schema.parse_many(queries)             # {'red': array('q', ...), ...}
+
+get_first_int is the helper from helperz.py, for code that already has a parse_qs
+dict. Importing this module doesn't import urllib.parse (several milliseconds) until
+a query actually needs unquoting, or array (which pulls in collections) until
+parse_many runs.
+"""
+
+DEFAULTS = {int: 0, float: 0.0, str: ""}
+TYPECODES = {int: "q", float: "d"}
+
+
+def _unquote(text):
+    from urllib.parse import unquote_plus
+
+    return unquote_plus(text)
+
+
+def get_first_int(values, key, default=0):
+    found = values.get(key, [""])
+    if found[0]:
+        return int(found[0])
+    return default
+
+
+class QuerySchema:
+    def __init__(self, **fields):
+        self.types = {}
+        self.defaults = {}
+        for name, spec in fields.items():
+            if isinstance(spec, tuple):
+                kind, default = spec
+            else:
+                kind, default = spec, DEFAULTS[spec]
+            self.types[name] = kind
+            self.defaults[name] = default
+
+    def parse(self, query):
+        values = self.defaults.copy()
+        pending = self.types.copy()
+        for part in query.split("&"):
+            key, _, raw = part.partition("=")
+            if "%" in key or "+" in key:
+                key = _unquote(key)
+            kind = pending.pop(key, None)
+            if kind is None:
+                continue
+            if raw:
+                if "%" in raw or "+" in raw:
+                    raw = _unquote(raw)
+                values[key] = raw if kind is str else kind(raw)
+            if not pending:
+                break
+        return values
+
+    def parse_many(self, queries):
+        """Parse a batch into columns: array.array for int/float fields, lists for str.
+
+        int columns are 64-bit, so a value outside that range raises OverflowError.
+        """
+        from array import array
+
+        columns = {
+            name: array(TYPECODES[kind]) if kind in TYPECODES else []
+            for name, kind in self.types.items()
+        }
+        appenders = [(name, column.append) for name, column in columns.items()]
+        parse = self.parse
+        for query in queries:
+            values = parse(query)
+            for name, append in appenders:
+                append(values[name])
+        return columns
@@ -0,0 +1,60 @@
+"""
+Extract red/green/blue/opacity ints from query strings with parse_qs +
+get_first_int versus QuerySchema.parse and QuerySchema.parse_many.
+
+    python query_benchmark.py            # 10^6 query strings
+    python query_benchmark.py 100000
+"""
+
+import random
+import sys
+from time import perf_counter
+from urllib.parse import parse_qs
+
+from query import QuerySchema, get_first_int
+
+KEYS = ("red", "green", "blue", "opacity")
+
+
+def with_parse_qs(queries):
+    rows = []
+    for query in queries:
+        values = parse_qs(query, keep_blank_values=True)
+        rows.append({key: get_first_int(values, key) for key in KEYS})
+    return rows
+
+
+def make_query():
+    parts = [f"{key}={random.choice(['', random.randrange(256)])}" for key in KEYS]
+    parts += ["session=abc123", "utm_source=news+letter", "ref=%2Fhome"]
+    random.shuffle(parts)
+    return "&".join(parts[: random.randint(4, len(parts))])
+
+
+def timed(fn):
+    start = perf_counter()
+    result = fn()
+    return result, perf_counter() - start
+
+
+def main(size=1_000_000):
+    queries = [make_query() for _ in range(size)]
+    schema = QuerySchema(**{key: int for key in KEYS})
+
+    expected, baseline = timed(lambda: with_parse_qs(queries))
+    rows, single = timed(lambda: [schema.parse(query) for query in queries])
+    columns, batch = timed(lambda: schema.parse_many(queries))
+    assert rows == expected
+    assert list(columns["red"]) == [row["red"] for row in expected]
+
+    print(f"{size} query strings")
+    for label, elapsed in (
+        ("parse_qs + get_first_int", baseline),
+        ("QuerySchema.parse", single),
+        ("QuerySchema.parse_many", batch),
+    ):
+        print(f"{label:>25}: {elapsed:7.3f} s  {size / elapsed:12,.0f} queries/s")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
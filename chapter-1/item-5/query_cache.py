@@ -0,0 +1,151 @@
+"""
+Bounded, thread-safe cache around query string parsing.
+
+Real traffic repeats the same few thousand query strings over and over, so parsing
+each one once and reusing the result saves most of the work. The cache is safe to
+share between the threads of a threaded server:
+
+    - BoundedCache: maxsize entries, evicting by "lru" (least recently used) or
+      "lfu" (least frequently used, oldest first on ties), with hit, miss and
+      eviction counters. The lock is not held while a value is computed, so two
+      threads that miss on the same key at once may both compute it and the
+      first stored value wins.
+    - CachedQueryParser: parse_qs / get_first_int / QuerySchema.parse on top of it.
+      Cached results are read-only (a MappingProxyType of tuples), so one caller
+      can't corrupt the entry every other caller shares.
+"""
+
+import threading
+from collections import OrderedDict, defaultdict
+from types import MappingProxyType
+
+
+class BoundedCache:
+    def __init__(self, maxsize=4096, policy="lru"):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        if policy not in ("lru", "lfu"):
+            raise ValueError(f"unknown eviction policy: {policy!r}")
+        self.maxsize = maxsize
+        self.policy = policy
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._values = {}
+        # lru: keys from least to most recently used
+        self._recent = OrderedDict()
+        # lfu: use count per key, and the keys at each count in insertion order
+        self._counts = {}
+        self._buckets = defaultdict(OrderedDict)
+        self._min_count = 0
+
+    def get(self, key, compute):
+        """Return the cached value for key, calling compute(key) on a miss."""
+        with self._lock:
+            if key in self._values:
+                self.hits += 1
+                self._touch(key)
+                return self._values[key]
+            self.misses += 1
+
+        value = compute(key)
+
+        with self._lock:
+            if key in self._values:
+                return self._values[key]
+            if len(self._values) >= self.maxsize:
+                self._evict()
+            self._values[key] = value
+            self._add(key)
+        return value
+
+    def _touch(self, key):
+        if self.policy == "lru":
+            self._recent.move_to_end(key)
+            return
+        count = self._counts[key]
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+            if self._min_count == count:
+                self._min_count = count + 1
+        self._counts[key] = count + 1
+        self._buckets[count + 1][key] = None
+
+    def _add(self, key):
+        if self.policy == "lru":
+            self._recent[key] = None
+            return
+        self._counts[key] = 1
+        self._buckets[1][key] = None
+        self._min_count = 1
+
+    def _evict(self):
+        if self.policy == "lru":
+            key, _ = self._recent.popitem(last=False)
+        else:
+            bucket = self._buckets[self._min_count]
+            key, _ = bucket.popitem(last=False)
+            if not bucket:
+                del self._buckets[self._min_count]
+            del self._counts[key]
+        del self._values[key]
+        self.evictions += 1
+
+    def __len__(self):
+        return len(self._values)
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+            self._recent.clear()
+            self._counts.clear()
+            self._buckets.clear()
+            self._min_count = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "size": len(self._values),
+                "maxsize": self.maxsize,
+                "policy": self.policy,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+def _frozen_parse_qs(query):
+    from urllib.parse import parse_qs  # only on a miss, and not at import
+
+    values = parse_qs(query, keep_blank_values=True)
+    return MappingProxyType({key: tuple(found) for key, found in values.items()})
+
+
+class CachedQueryParser:
+    def __init__(self, schema=None, maxsize=4096, policy="lru"):
+        self.schema = schema
+        self.cache = BoundedCache(maxsize, policy)
+
+    def parse_qs(self, query):
+        """parse_qs(query, keep_blank_values=True), as a read-only mapping of tuples."""
+        return self.cache.get(("qs", query), lambda key: _frozen_parse_qs(query))
+
+    def get_first_int(self, query, key, default=0):
+        found = self.parse_qs(query).get(key, ("",))
+        if found[0]:
+            return int(found[0])
+        return default
+
+    def parse(self, query):
+        """schema.parse(query), as a read-only mapping."""
+        if self.schema is None:
+            raise ValueError("CachedQueryParser was created without a schema")
+        return self.cache.get(
+            ("schema", query), lambda key: MappingProxyType(self.schema.parse(query))
+        )
+
+    def stats(self):
+        return self.cache.stats()
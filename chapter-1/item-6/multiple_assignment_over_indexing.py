@@ -3,7 +3,7 @@ Python has a built in tuple type that can be used to create immutable
 ordered sequences of values
 """
 
-import time
+from time import perf_counter
 
 snack_cals = {
     "chips": 140,
@@ -57,9 +57,9 @@ def bubble_sort(a):
 
 names = ["abraham", "cain", "abel", "judah", "luke"]
 print(len(names))
-start = time.time()
+start = perf_counter()
 bubble_sort(names)
-end = time.time()
+end = perf_counter()
 print(f"Names: {names}, Time elapsed: {end - start}")
 
 
@@ -73,9 +73,9 @@ def bubble_sort(a):
 
 names = ["abraham", "cain", "abel", "judah", "luke"]
 print(len(names))
-start = time.time()
+start = perf_counter()
 bubble_sort(names)
-end = time.time()
+end = perf_counter()
 print(f"Names: {names}, Time elapsed: {end - start}")
 
 """
@@ -84,6 +84,25 @@ put into a new temporary tuple
 Then the left side is used to receive that tuple value and assign it to the variable names a[i-1] and a[i]
 """
 
+"""
+time.time() is the wall clock and can jump or have coarse resolution, so timings use
+perf_counter instead.
+
+bubble_sort is O(n^2) no matter what the input looks like. sorting.py turns this into
+a real module: insertion sort for tiny inputs, an early-exit bubble pass for nearly
+sorted data, and a run-detecting merge sort for everything else, all behind
+sort(a, key=None). sorting_benchmark.py compares them from 10 to 10^6 elements
+"""
+import sorting
+
+names = ["abraham", "cain", "abel", "judah", "luke"]
+sorting.sort(names)
+print(names)
+
+snacks_by_cals = [("bacon", 350), ("donut", 240), ("muffin", 190)]
+sorting.sort(snacks_by_cals, key=lambda snack: snack[1])
+print(snacks_by_cals)
+
 snacks = [("bacon", 350), ("donut", 240), ("muffin", 190)]
 for i in range(len(snacks)):
     item = snacks[i]
@@ -0,0 +1,187 @@
+"""
+Sorting module built out of the bubble_sort examples in
+multiple_assignment_over_indexing.py.
+
+Every function sorts the list in place and is stable, like list.sort. They all
+work on two parallel lists: the keys that get compared and the values that get
+moved. Without a key function the values are the keys, so the same list is
+passed for both and each plain assignment is simply written twice (swaps and
+slice copies check for this so they happen only once).
+
+    - insertion_sort: best for tiny inputs, no bookkeeping at all
+    - bubble_sort: early-exit passes in both directions, for nearly-sorted data
+    - merge_sort: Timsort-style, finds ascending/descending runs, pads short
+      runs to MIN_RUN with insertion sort, then merges neighbouring runs
+    - sort: picks one of the above from the size and shape of the input
+"""
+
+SMALL = 32
+MIN_RUN = 32
+
+
+def _prepare(a, key):
+    if key is None:
+        return a, a
+    return [key(x) for x in a], a
+
+
+def _insertion(keys, vals, lo, hi, start=None):
+    # keys[lo:start] is already sorted
+    for i in range(start or lo + 1, hi):
+        k = keys[i]
+        v = vals[i]
+        j = i
+        while j > lo and k < keys[j - 1]:
+            keys[j] = keys[j - 1]
+            vals[j] = vals[j - 1]
+            j -= 1
+        keys[j] = k
+        vals[j] = v
+
+
+def _bubble(keys, vals, max_passes=None):
+    """Cocktail-shaker passes that stop as soon as a pass makes no swaps.
+
+    Returns True once the list is sorted, or False if it ran out of passes.
+    """
+    paired = vals is not keys  # a swap is not idempotent, so only do it once
+    lo = 0
+    hi = len(keys) - 1
+    passes = 0
+    while lo < hi:
+        if max_passes is not None and passes >= max_passes:
+            return False
+        passes += 1
+
+        # forward: everything after the last swap is in its final place
+        last = None
+        for i in range(lo + 1, hi + 1):
+            if keys[i] < keys[i - 1]:
+                keys[i - 1], keys[i] = keys[i], keys[i - 1]
+                if paired:
+                    vals[i - 1], vals[i] = vals[i], vals[i - 1]
+                last = i
+        if last is None:
+            return True
+        hi = last - 1
+
+        # backward: everything before the last swap is in its final place
+        first = None
+        for i in range(hi - 1, lo - 1, -1):
+            if keys[i + 1] < keys[i]:
+                keys[i], keys[i + 1] = keys[i + 1], keys[i]
+                if paired:
+                    vals[i], vals[i + 1] = vals[i + 1], vals[i]
+                first = i
+        if first is None:
+            return True
+        lo = first + 1
+    return True
+
+
+def _reverse(keys, vals, lo, hi):
+    keys[lo:hi] = keys[lo:hi][::-1]
+    if vals is not keys:
+        vals[lo:hi] = vals[lo:hi][::-1]
+
+
+def _runs(keys, vals):
+    n = len(keys)
+    runs = []
+    lo = 0
+    while lo < n:
+        hi = lo + 1
+        if hi < n and keys[hi] < keys[lo]:
+            # strictly descending, so reversing it cannot reorder equal keys
+            while hi < n and keys[hi] < keys[hi - 1]:
+                hi += 1
+            _reverse(keys, vals, lo, hi)
+        else:
+            while hi < n and not keys[hi] < keys[hi - 1]:
+                hi += 1
+
+        end = min(max(hi, lo + MIN_RUN), n)
+        if end > hi:
+            _insertion(keys, vals, lo, end, start=hi)
+        runs.append(end)
+        lo = end
+    return runs
+
+
+def _merge(keys, vals, lo, mid, hi):
+    if not keys[mid] < keys[mid - 1]:
+        return  # already in order
+
+    left_keys = keys[lo:mid]
+    left_vals = left_keys if vals is keys else vals[lo:mid]
+    i = 0
+    j = mid
+    k = lo
+    end = mid - lo
+    while i < end and j < hi:
+        if keys[j] < left_keys[i]:
+            keys[k] = keys[j]
+            vals[k] = vals[j]
+            j += 1
+        else:
+            keys[k] = left_keys[i]
+            vals[k] = left_vals[i]
+            i += 1
+        k += 1
+
+    keys[k : k + end - i] = left_keys[i:]
+    if vals is not keys:
+        vals[k : k + end - i] = left_vals[i:]
+
+
+def _merge_sort(keys, vals):
+    bounds = [0] + _runs(keys, vals)
+    while len(bounds) > 2:
+        merged = [0]
+        for i in range(2, len(bounds), 2):
+            _merge(keys, vals, bounds[i - 2], bounds[i - 1], bounds[i])
+            merged.append(bounds[i])
+        if len(bounds) % 2 == 0:
+            merged.append(bounds[-1])
+        bounds = merged
+
+
+def insertion_sort(a, key=None):
+    keys, vals = _prepare(a, key)
+    _insertion(keys, vals, 0, len(a))
+
+
+def bubble_sort(a, key=None):
+    keys, vals = _prepare(a, key)
+    _bubble(keys, vals)
+
+
+def merge_sort(a, key=None):
+    keys, vals = _prepare(a, key)
+    _merge_sort(keys, vals)
+
+
+def _descents(keys):
+    return sum(1 for i in range(1, len(keys)) if keys[i] < keys[i - 1])
+
+
+def sort(a, key=None):
+    """Sort a in place, choosing the algorithm from the input.
+
+    - tiny inputs go straight to insertion sort
+    - inputs with only a handful of out-of-order neighbours get two early-exit
+      bubble passes, and fall through to merge_sort if that wasn't enough
+    - everything else goes to merge_sort
+    """
+    keys, vals = _prepare(a, key)
+    n = len(keys)
+    if n <= SMALL:
+        _insertion(keys, vals, 0, n)
+        return
+
+    descents = _descents(keys)
+    if descents == 0:
+        return
+    if descents <= n // 256 + 1 and _bubble(keys, vals, max_passes=2):
+        return
+    _merge_sort(keys, vals)
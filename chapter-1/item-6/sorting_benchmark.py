@@ -0,0 +1,73 @@
+"""
+perf_counter timings for the variants in sorting.py on random, sorted, reversed
+and few-unique inputs, with list.sort as the reference.
+
+The quadratic sorts are skipped above QUADRATIC_LIMIT elements, where a single
+run would take minutes.
+
+    python sorting_benchmark.py            # 10 .. 10^6 elements
+    python sorting_benchmark.py 10000      # stop at 10^4 elements
+"""
+
+import random
+import sys
+from time import perf_counter
+
+import sorting
+
+QUADRATIC_LIMIT = 1_000
+
+
+def original_bubble_sort(a):
+    for _ in range(len(a)):
+        for i in range(1, len(a)):
+            if a[i] < a[i - 1]:
+                a[i - 1], a[i] = a[i], a[i - 1]
+
+
+INPUTS = {
+    "random": lambda n: [random.random() for _ in range(n)],
+    "sorted": lambda n: list(range(n)),
+    "reversed": lambda n: list(range(n, 0, -1)),
+    "few-unique": lambda n: [random.randrange(4) for _ in range(n)],
+}
+
+VARIANTS = {
+    "sort": (sorting.sort, False),
+    "merge_sort": (sorting.merge_sort, False),
+    "insertion_sort": (sorting.insertion_sort, True),
+    "bubble_sort": (sorting.bubble_sort, True),
+    "original bubble": (original_bubble_sort, True),
+    "list.sort": (list.sort, False),
+}
+
+
+def timed(fn, data, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        a = list(data)
+        start = perf_counter()
+        fn(a)
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def main(max_size=1_000_000):
+    print(f"{'n':>8} {'input':>10} " + " ".join(f"{name:>15}" for name in VARIANTS))
+    size = 10
+    while size <= max_size:
+        repeat = 5 if size <= 1_000 else 1
+        for label, make in INPUTS.items():
+            data = make(size)
+            cells = []
+            for fn, quadratic in VARIANTS.values():
+                if quadratic and size > QUADRATIC_LIMIT:
+                    cells.append(f"{'-':>15}")
+                else:
+                    cells.append(f"{timed(fn, data, repeat):>15.6f}")
+            print(f"{size:>8} {label:>10} " + " ".join(cells))
+        size *= 10
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,286 @@
+"""
+Random bit masks in bulk, stored packed.
+
+The random_bits loop makes one randint call and one shift per bit. Here the bits come
+from a single random.getrandbits (or os.urandom) call for the whole batch and sit
+in a bytearray, 8 to a byte, with bit i of a mask at byte i // 8, bit i % 8. That's
+the order int.from_bytes(..., "little") uses, so a mask converts to the same int the
+loop builds with random_bits |= 1 << i.
+
+    - BitSet: one set of nbits bits. set / clear / test take many indices per call;
+      count() is the popcount; &, |, ^ and ~ work on whole bitsets at once by
+      converting to Python ints, whose bitwise operations run in C over the whole
+      buffer
+    - MaskArray: count masks of nbits bits each, back to back (each padded to whole
+      bytes). Iterating gives each mask as an int, and the bitwise operators work on
+      all the masks at once, against another MaskArray or one mask applied to every
+      mask
+
+    masks = MaskArray.random(1_000_000, 64)
+    for mask in masks: ...                 # ints, like random_bits
+    masks &= 0xFFFF                        # keep the low 16 features of every mask
+    masks.test(3)                          # bit 3 of every mask
+"""
+
+import os
+import random
+import sys
+from array import array
+
+_BITS_IN = [[bit for bit in range(8) if byte >> bit & 1] for byte in range(256)]
+# array typecodes that read a whole mask of this many bytes as one native int
+_TYPECODES = {array(code).itemsize: code for code in "BHIQ"} if sys.byteorder == "little" else {}
+
+
+def _random_bytes(nbytes, rng, source):
+    if source == "urandom":
+        return os.urandom(nbytes)
+    if source != "random":
+        raise ValueError(f"source must be 'random' or 'urandom', not {source!r}")
+    if not nbytes:
+        return b""
+    return (rng or random).getrandbits(nbytes * 8).to_bytes(nbytes, "little")
+
+
+def _to_int(data):
+    return int.from_bytes(data, "little")
+
+
+class BitSet:
+    __slots__ = ("nbits", "data")
+
+    def __init__(self, nbits, data=None):
+        nbytes = (nbits + 7) // 8
+        if data is None:
+            data = bytearray(nbytes)
+        elif len(data) != nbytes:
+            raise ValueError(f"{nbits} bits need {nbytes} bytes, got {len(data)}")
+        self.nbits = nbits
+        self.data = bytearray(data)
+        self._trim()
+
+    def _trim(self):
+        """Clear the unused bits of the last byte, so they never show up as set."""
+        spare = -self.nbits % 8
+        if spare:
+            self.data[-1] &= 0xFF >> spare
+
+    @classmethod
+    def random(cls, nbits, rng=None, source="random"):
+        return cls(nbits, _random_bytes((nbits + 7) // 8, rng, source))
+
+    @classmethod
+    def from_int(cls, value, nbits):
+        return cls(nbits, (value & ((1 << nbits) - 1)).to_bytes((nbits + 7) // 8, "little"))
+
+    def __int__(self):
+        return _to_int(self.data)
+
+    def __len__(self):
+        return self.nbits
+
+    def _check(self, index):
+        if not 0 <= index < self.nbits:
+            raise IndexError(f"bit {index} out of range for {self.nbits} bits")
+
+    def __getitem__(self, index):
+        self._check(index)
+        return bool(self.data[index >> 3] >> (index & 7) & 1)
+
+    def set(self, indices):
+        data = self.data
+        nbits = self.nbits
+        for index in indices:
+            if not 0 <= index < nbits:
+                self._check(index)
+            data[index >> 3] |= 1 << (index & 7)
+
+    def clear(self, indices):
+        data = self.data
+        nbits = self.nbits
+        for index in indices:
+            if not 0 <= index < nbits:
+                self._check(index)
+            data[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+
+    def test(self, indices):
+        """[self[i] for i in indices]."""
+        data = self.data
+        nbits = self.nbits
+        result = []
+        for index in indices:
+            if not 0 <= index < nbits:
+                self._check(index)
+            result.append(bool(data[index >> 3] >> (index & 7) & 1))
+        return result
+
+    def count(self):
+        return _to_int(self.data).bit_count()
+
+    def indices(self):
+        """Positions of the set bits, in order."""
+        for position, byte in enumerate(self.data):
+            if byte:
+                base = position * 8
+                for bit in _BITS_IN[byte]:
+                    yield base + bit
+
+    def _other(self, other):
+        if isinstance(other, BitSet):
+            if other.nbits != self.nbits:
+                raise ValueError(f"can't combine {self.nbits} and {other.nbits} bit sets")
+            return _to_int(other.data)
+        return other
+
+    def _result(self, value):
+        return BitSet.from_int(value, self.nbits)
+
+    def __and__(self, other):
+        return self._result(_to_int(self.data) & self._other(other))
+
+    def __or__(self, other):
+        return self._result(_to_int(self.data) | self._other(other))
+
+    def __xor__(self, other):
+        return self._result(_to_int(self.data) ^ self._other(other))
+
+    def __invert__(self):
+        return self._result(~_to_int(self.data))
+
+    def __iand__(self, other):
+        self.data[:] = (self & other).data
+        return self
+
+    def __ior__(self, other):
+        self.data[:] = (self | other).data
+        return self
+
+    def __ixor__(self, other):
+        self.data[:] = (self ^ other).data
+        return self
+
+    def __eq__(self, other):
+        if not isinstance(other, BitSet):
+            return NotImplemented
+        return self.nbits == other.nbits and self.data == other.data
+
+    def __repr__(self):
+        return f"BitSet({self.nbits}, {int(self):#x})"
+
+
+class MaskArray:
+    __slots__ = ("count", "nbits", "stride", "data")
+
+    def __init__(self, count, nbits, data=None):
+        self.count = count
+        self.nbits = nbits
+        self.stride = (nbits + 7) // 8
+        if data is None:
+            data = bytearray(count * self.stride)
+        elif len(data) != count * self.stride:
+            raise ValueError(f"{count} x {nbits} bit masks need {count * self.stride} bytes")
+        self.data = bytearray(data)
+        if nbits % 8:
+            self._apply(_to_int(self._broadcast((1 << nbits) - 1)), int.__and__)
+
+    @classmethod
+    def random(cls, count, nbits, rng=None, source="random"):
+        stride = (nbits + 7) // 8
+        return cls(count, nbits, _random_bytes(count * stride, rng, source))
+
+    def __len__(self):
+        return self.count
+
+    def _index(self, j):
+        if not -self.count <= j < self.count:
+            raise IndexError("mask index out of range")
+        return j % self.count
+
+    def __getitem__(self, j):
+        j = self._index(j)
+        return _to_int(self.data[j * self.stride : (j + 1) * self.stride])
+
+    def __iter__(self):
+        typecode = _TYPECODES.get(self.stride)
+        if typecode is not None:
+            masks = array(typecode)
+            masks.frombytes(self.data)
+            return iter(masks.tolist())
+        stride = self.stride
+        data = self.data
+        return (_to_int(data[start : start + stride]) for start in range(0, len(data), stride))
+
+    def bitset(self, j):
+        """Mask j as a BitSet (a copy)."""
+        j = self._index(j)
+        return BitSet(self.nbits, self.data[j * self.stride : (j + 1) * self.stride])
+
+    def _check(self, bit):
+        if not 0 <= bit < self.nbits:
+            raise IndexError(f"bit {bit} out of range for {self.nbits} bit masks")
+
+    def test(self, bit):
+        """Bit `bit` of every mask, as a list of bools like BitSet.test."""
+        self._check(bit)
+        mask = 1 << (bit & 7)
+        return [byte & mask != 0 for byte in self.data[bit >> 3 :: self.stride]]
+
+    def set(self, bit):
+        """Set bit `bit` in every mask."""
+        self._check(bit)
+        self |= 1 << bit
+
+    def clear(self, bit):
+        """Clear bit `bit` in every mask."""
+        self._check(bit)
+        self &= ((1 << self.nbits) - 1) ^ (1 << bit)
+
+    def popcounts(self):
+        return [mask.bit_count() for mask in self]
+
+    def total(self):
+        """Set bits across all the masks."""
+        return _to_int(self.data).bit_count()
+
+    def _broadcast(self, mask):
+        return (mask & ((1 << self.nbits) - 1)).to_bytes(self.stride, "little") * self.count
+
+    def _operand(self, other):
+        if isinstance(other, MaskArray):
+            if (other.count, other.nbits) != (self.count, self.nbits):
+                raise ValueError("mask arrays must have the same shape")
+            return _to_int(other.data)
+        return _to_int(self._broadcast(other))
+
+    def _apply(self, operand, op):
+        value = op(_to_int(self.data), operand)
+        self.data[:] = value.to_bytes(len(self.data), "little")
+
+    def _combined(self, other, op):
+        result = MaskArray(self.count, self.nbits, self.data)
+        result._apply(self._operand(other), op)
+        return result
+
+    def __and__(self, other):
+        return self._combined(other, int.__and__)
+
+    def __or__(self, other):
+        return self._combined(other, int.__or__)
+
+    def __xor__(self, other):
+        return self._combined(other, int.__xor__)
+
+    def __iand__(self, other):
+        self._apply(self._operand(other), int.__and__)
+        return self
+
+    def __ior__(self, other):
+        self._apply(self._operand(other), int.__or__)
+        return self
+
+    def __ixor__(self, other):
+        self._apply(self._operand(other), int.__xor__)
+        return self
+
+    def __repr__(self):
+        return f"MaskArray({self.count} masks x {self.nbits} bits)"
@@ -0,0 +1,82 @@
+"""
+Random masks per second: the randint loop from enum_over_range.py against one
+getrandbits call per mask and against MaskArray's single call for the whole batch,
+then whole-bitset operations on a large BitSet.
+
+    python bitset_benchmark.py              # 200_000 masks of 64 bits
+    python bitset_benchmark.py 100000 128
+"""
+
+import random
+import sys
+from time import perf_counter
+
+from bitset import BitSet, MaskArray
+
+
+def randint_loop(count, nbits):
+    randint = random.randint
+    masks = []
+    for _ in range(count):
+        random_bits = 0
+        for i in range(nbits):
+            if randint(0, 1):
+                random_bits |= 1 << i
+        masks.append(random_bits)
+    return masks
+
+
+def getrandbits_each(count, nbits):
+    getrandbits = random.getrandbits
+    return [getrandbits(nbits) for _ in range(count)]
+
+
+def bulk(source):
+    def run(count, nbits):
+        return list(MaskArray.random(count, nbits, source=source))
+
+    return run
+
+
+def report(label, elapsed, count, nbits):
+    print(
+        f"{label:>28}: {elapsed:8.3f} s  {count / elapsed:14,.0f} masks/s"
+        f"  {count * nbits / elapsed:16,.0f} bits/s"
+    )
+
+
+def main(count=200_000, nbits=64):
+    print(f"{count:,} random masks of {nbits} bits")
+    # the per-bit loop is far slower; time it on a slice and scale
+    loop_count = max(1, count // 20)
+    start = perf_counter()
+    randint_loop(loop_count, nbits)
+    report(f"randint loop ({loop_count:,})", perf_counter() - start, loop_count, nbits)
+    for label, run in [
+        ("getrandbits per mask", getrandbits_each),
+        ("MaskArray getrandbits", bulk("random")),
+        ("MaskArray urandom", bulk("urandom")),
+    ]:
+        start = perf_counter()
+        masks = run(count, nbits)
+        report(label, perf_counter() - start, count, nbits)
+        assert len(masks) == count
+
+    big = 10_000_000
+    a = BitSet.random(big)
+    b = BitSet.random(big)
+    print(f"BitSet of {big:,} bits")
+    for label, op in [
+        ("a & b", lambda: a & b),
+        ("a ^ b", lambda: a ^ b),
+        ("a.count()", a.count),
+        ("a.test(100_000 indices)", lambda: a.test(range(0, big, big // 100_000))),
+    ]:
+        start = perf_counter()
+        op()
+        elapsed = perf_counter() - start
+        print(f"{label:>28}: {elapsed * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,98 @@
+"""
+enumerate, a block at a time.
+
+enumerate(flavor_list) hands out one (index, item) pair per loop iteration, and the
+loop body runs once per item. For millions of items that per-item overhead is
+most of the cost. enumerate_chunks yields (start_index, chunk) instead, so the
+body runs once per chunk and can hand the whole chunk to something that loops in
+C (sum, map, bytes methods, array, NumPy):
+
+    for start, chunk in enumerate_chunks(values, 65_536):
+        total += sum(chunk)                   # items start .. start + len(chunk) - 1
+
+    - lists, tuples, str, bytes, bytearray, array, memoryview and range are sliced,
+      so each chunk is the same type as the source
+    - binary files are read chunk_size bytes at a time; start is the byte offset
+    - text files and any other iterable (generators, csv readers) go through
+      islice, so each chunk is a list of chunk_size items (lines, for a file)
+
+map_chunks(fn, source) runs fn(start_index, chunk) on every chunk in a thread or
+process pool and yields (start_index, result) in source order, whatever order the
+workers finish in. Only a few chunks per worker are read ahead, so a huge generator
+or file is never pulled into memory at once. Threads help when fn releases the GIL
+(I/O, hashlib, zlib, NumPy); for pure-Python fn use processes, and then fn has to
+be picklable (a module-level function).
+"""
+
+import io
+import os
+from collections import deque
+from array import array
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
+
+POOLS = {"thread": ThreadPoolExecutor, "process": ProcessPoolExecutor}
+# types whose slices are cheap copies (or views) of the same type; anything else, even
+# with __getitem__ and __len__ (deque, mappings), goes through islice
+SLICEABLE = (list, tuple, str, bytes, bytearray, array, memoryview, range)
+
+
+def enumerate_chunks(source, chunk_size=65_536, start=0):
+    """Yield (index of the chunk's first item, chunk) over source."""
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    if isinstance(source, (io.RawIOBase, io.BufferedIOBase)):
+        return _file_chunks(source, chunk_size, start)
+    if isinstance(source, SLICEABLE):
+        return _sequence_chunks(source, chunk_size, start)
+    return _iterator_chunks(source, chunk_size, start)
+
+
+def _sequence_chunks(source, chunk_size, start):
+    for offset in range(0, len(source), chunk_size):
+        yield start + offset, source[offset : offset + chunk_size]
+
+
+def _file_chunks(source, chunk_size, start):
+    while chunk := source.read(chunk_size):
+        yield start, chunk
+        start += len(chunk)
+
+
+def _iterator_chunks(source, chunk_size, start):
+    iterator = iter(source)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield start, chunk
+        start += len(chunk)
+
+
+def map_chunks(
+    fn, source, chunk_size=65_536, start=0, pool="thread", workers=None, executor=None
+):
+    """Yield (start_index, fn(start_index, chunk)) for every chunk, in order, from a pool.
+
+    pool is "thread" or "process"; pass executor to reuse one you already have
+    (it is not shut down). workers defaults to os.cpu_count().
+    """
+    if executor is None and pool not in POOLS:
+        raise ValueError(f"pool must be one of {tuple(POOLS)}, not {pool!r}")
+    workers = workers or os.cpu_count() or 1
+    chunks = enumerate_chunks(source, chunk_size, start)
+    own = executor is None
+    if own:
+        executor = POOLS[pool](workers)
+    pending = deque()  # (start, future), oldest first
+    try:
+        for chunk_start, chunk in chunks:
+            pending.append((chunk_start, executor.submit(fn, chunk_start, chunk)))
+            if len(pending) >= 2 * workers:
+                chunk_start, future = pending.popleft()
+                yield chunk_start, future.result()
+        while pending:
+            chunk_start, future = pending.popleft()
+            yield chunk_start, future.result()
+    finally:
+        for _, future in pending:
+            future.cancel()
+        if own:
+            executor.shutdown(wait=True, cancel_futures=True)
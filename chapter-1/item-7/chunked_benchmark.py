@@ -0,0 +1,73 @@
+"""
+Largest value and where it is, over 10**7 values: the enumerate loop from
+enum_over_range.py, one (index, item) pair at a time, against enumerate_chunks (one
+loop iteration per chunk, max and index done by C over the chunk) and map_chunks in
+a thread and a process pool.
+
+The chunk's start index turns chunk.index(best) back into a position in the whole
+sequence, so the chunked versions give the same answer as enumerate.
+
+    python chunked_benchmark.py               # 10_000_000 values
+    python chunked_benchmark.py 1000000 16384
+"""
+
+import sys
+from time import perf_counter
+
+from chunked import enumerate_chunks, map_chunks
+
+
+def per_item(values, chunk_size):
+    best_index, best = -1, None
+    for i, x in enumerate(values):
+        if best is None or x > best:
+            best_index, best = i, x
+    return best_index, best
+
+
+def chunk_best(start, chunk):
+    best = max(chunk)
+    return start + chunk.index(best), best
+
+
+def pick(candidates):
+    best_index, best = -1, None
+    for index, value in candidates:
+        if best is None or value > best:
+            best_index, best = index, value
+    return best_index, best
+
+
+def chunked(values, chunk_size):
+    return pick(chunk_best(start, chunk) for start, chunk in enumerate_chunks(values, chunk_size))
+
+
+def pooled(pool):
+    def run(values, chunk_size):
+        return pick(result for _, result in map_chunks(chunk_best, values, chunk_size, pool=pool))
+
+    return run
+
+
+def main(n=10_000_000, chunk_size=65_536):
+    values = [i * 7919 % 1_000_003 for i in range(n)]
+    print(f"{n:,} values, chunks of {chunk_size:,}")
+    expected = None
+    for label, source, fn in [
+        ("enumerate, per item", lambda: values, per_item),
+        ("enumerate_chunks, list", lambda: values, chunked),
+        ("enumerate_chunks, generator", lambda: (x for x in values), chunked),
+        ("map_chunks, threads", lambda: values, pooled("thread")),
+        ("map_chunks, processes", lambda: values, pooled("process")),
+    ]:
+        start = perf_counter()
+        result = fn(source(), chunk_size)
+        elapsed = perf_counter() - start
+        if expected is None:
+            expected = result
+        assert result == expected, (label, result, expected)
+        print(f"{label:>28}: {elapsed:7.3f} s  {n / elapsed:14,.0f} items/s")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
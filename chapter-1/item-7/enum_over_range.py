@@ -18,6 +18,14 @@ for i in range(3):
         random_bits |= 1 << i
     print(bin(random_bits))
 
+# one randint call per bit is slow for many masks; bitset.MaskArray draws all of
+# them with a single getrandbits call and keeps them packed. See bitset_benchmark.py
+from bitset import MaskArray
+
+masks = MaskArray.random(4, 3)
+print([bin(mask) for mask in masks])
+print(masks.test(0))  # bit 0 of every mask
+
 
 # when you have a data structure ot iterate over, like a list of strinsg,
 # you can loop directly over the sequence
@@ -61,6 +69,13 @@ for i, flavor in enumerate(flavor_list):
 for i, flavor in enumerate(flavor_list, 1):
     print(f"{i}: {flavor}")
 
+# for big data, chunked.enumerate_chunks gives (start index, chunk) pairs, so the
+# loop runs once per chunk instead of once per item. See chunked_benchmark.py
+from chunked import enumerate_chunks
+
+for start, chunk in enumerate_chunks(flavor_list, 3, 1):
+    print(f"{start}-{start + len(chunk) - 1}: {chunk}")
+
 """
 `enumerate` provides concise syntax for looping over an iterator and getting the index
 of each item from the iterator as you go
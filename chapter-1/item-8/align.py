@@ -0,0 +1,221 @@
+"""
+Aligning several streams that arrive at different rates.
+
+zip_longest(names, counts) pairs items by position and pads with None. Aligner
+generalizes that to N iterators, sync or async:
+
+    for row in Aligner(prices, volumes, fill="last"): ...                # by position
+    for row in Aligner(trades, quotes, key=itemgetter(0), fill="last"): ...   # by key
+    async for row in Aligner(feed_a, feed_b, key=..., buffer=256): ...
+
+    - by position (key=None): row n holds item n of every stream, like zip_longest
+    - by key: every stream must be sorted by key(item), and they are merged k-way
+      through a heap into one row per key, holding each stream's item with that key.
+      A key that shows up twice in one stream gives two rows
+    - fill says what a row holds for a stream with nothing there: "default" (the
+      default value, like zip_longest's fillvalue), "last" (that stream's latest
+      item so far, default before it has one) or "drop" (skip the row; by position
+      that means stopping at the shortest stream, like zip)
+
+Iterating synchronously pulls items only as rows need them, so nothing is buffered.
+Iterating asynchronously reads each stream in its own task into a queue of at most
+`buffer` items; a stream that runs ahead of the others waits for room instead of
+filling memory, and the aligner awaits all the streams it needs at once.
+
+aligner.stats has a StreamStats per stream: items read, rows it had to be filled
+in, time spent waiting for it, how full its queue got, and (by key, with numeric
+keys) how far its last item lagged behind the row's key when it was filled.
+"""
+
+import asyncio
+import heapq
+from time import perf_counter
+
+FILLS = ("default", "last", "drop")
+_DONE = object()
+_SKIP = object()  # a "drop" row that was left out
+
+
+class StreamStats:
+    __slots__ = ("items", "filled", "wait", "max_buffered", "max_key_lag")
+
+    def __init__(self):
+        self.items = 0
+        self.filled = 0
+        self.wait = 0.0
+        self.max_buffered = 0
+        self.max_key_lag = None
+
+    def __repr__(self):
+        return (
+            f"StreamStats(items={self.items}, filled={self.filled}, wait={self.wait:.3f}s, "
+            f"max_buffered={self.max_buffered}, max_key_lag={self.max_key_lag})"
+        )
+
+
+class _Merger:
+    """The alignment itself, fed one item at a time by the sync or async driver."""
+
+    def __init__(self, width, key, fill, default, stats):
+        self.width = width
+        self.key = key
+        self.fill = fill
+        self.default = default
+        self.stats = stats
+        self.live = list(range(width))
+        self.last = [default] * width
+        self.last_key = [None] * width
+        self.heads = {}  # stream -> item waiting to go into a row
+        self.heap = []  # by key: (key, stream)
+        self.finished = False
+
+    def needed(self):
+        """Streams that have to deliver an item before the next row can be made."""
+        if self.finished:
+            return []
+        return [i for i in self.live if i not in self.heads]
+
+    def feed(self, i, item):
+        if item is _DONE:
+            self.live.remove(i)
+            if self.fill == "drop":
+                self.finished = True  # no complete row can come after this
+            return
+        self.stats[i].items += 1
+        self.heads[i] = item
+        if self.key is not None:
+            item_key = self.key(item)
+            if self.last_key[i] is not None and item_key < self.last_key[i]:
+                raise ValueError(f"stream {i} is not sorted by key")
+            heapq.heappush(self.heap, (item_key, i))
+
+    def row(self):
+        """The next row once needed() is empty, or None when the streams are done."""
+        if self.finished or not self.heads:
+            self.finished = True
+            return None
+        if self.key is None:
+            present = list(self.heads)
+            row_key = None
+        else:
+            row_key, first = heapq.heappop(self.heap)
+            present = [first]
+            while self.heap and self.heap[0][0] == row_key:
+                present.append(heapq.heappop(self.heap)[1])
+
+        values = list(self.last) if self.fill == "last" else [self.default] * self.width
+        for i in present:
+            values[i] = self.last[i] = self.heads.pop(i)
+            if row_key is not None:
+                self.last_key[i] = row_key
+        if len(present) < self.width:
+            for i in range(self.width):
+                if i not in present:
+                    self._filled(i, row_key)
+            if self.fill == "drop":
+                return _SKIP
+        return tuple(values)
+
+    def _filled(self, i, row_key):
+        stats = self.stats[i]
+        stats.filled += 1
+        if row_key is None or self.last_key[i] is None:
+            return
+        try:
+            lag = row_key - self.last_key[i]
+        except TypeError:
+            return
+        if stats.max_key_lag is None or lag > stats.max_key_lag:
+            stats.max_key_lag = lag
+
+
+class Aligner:
+    def __init__(self, *streams, key=None, fill="default", default=None, buffer=64):
+        if fill not in FILLS:
+            raise ValueError(f"fill must be one of {FILLS}, not {fill!r}")
+        if buffer < 1:
+            raise ValueError("buffer must be at least 1")
+        self.streams = streams
+        self.key = key
+        self.fill = fill
+        self.default = default
+        self.buffer = buffer
+        self.stats = [StreamStats() for _ in streams]
+
+    def _merger(self):
+        self.stats = [StreamStats() for _ in self.streams]
+        return _Merger(len(self.streams), self.key, self.fill, self.default, self.stats)
+
+    def __iter__(self):
+        merger = self._merger()
+        iterators = [iter(stream) for stream in self.streams]
+        stats = self.stats
+        while True:
+            for i in merger.needed():
+                start = perf_counter()
+                item = next(iterators[i], _DONE)
+                stats[i].wait += perf_counter() - start
+                merger.feed(i, item)
+            row = merger.row()
+            if row is None:
+                return
+            if row is not _SKIP:
+                yield row
+
+    async def __aiter__(self):
+        merger = self._merger()
+        stats = self.stats
+        queues = [asyncio.Queue(self.buffer) for _ in self.streams]
+        errors = {}
+
+        async def pump(i, stream):
+            queue = queues[i]
+            try:
+                if hasattr(stream, "__aiter__"):
+                    async for item in stream:
+                        await queue.put(item)
+                else:
+                    for item in stream:
+                        await queue.put(item)
+            except Exception as exc:
+                errors[i] = exc  # raised by take() when the aligner gets this far
+            await queue.put(_DONE)
+
+        def received(i, item):
+            if item is _DONE and i in errors:
+                raise errors[i]
+            merger.feed(i, item)
+
+        async def take(i):
+            start = perf_counter()
+            item = await queues[i].get()
+            stats[i].wait += perf_counter() - start
+            return item
+
+        pumps = [asyncio.create_task(pump(i, stream)) for i, stream in enumerate(self.streams)]
+        try:
+            while True:
+                # take what's already queued without suspending; only await the
+                # streams that have nothing ready, all at once
+                waiting = []
+                for i in merger.needed():
+                    queue = queues[i]
+                    if queue.empty():
+                        waiting.append(i)
+                        continue
+                    if queue.qsize() > stats[i].max_buffered:
+                        stats[i].max_buffered = queue.qsize()
+                    received(i, queue.get_nowait())
+                if len(waiting) == 1:
+                    received(waiting[0], await take(waiting[0]))
+                elif waiting:
+                    for i, item in zip(waiting, await asyncio.gather(*map(take, waiting))):
+                        received(i, item)
+                row = merger.row()
+                if row is None:
+                    break
+                if row is not _SKIP:
+                    yield row
+        finally:
+            for task in pumps:
+                task.cancel()
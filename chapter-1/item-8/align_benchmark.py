@@ -0,0 +1,121 @@
+"""
+Aligner on three sorted feeds of (timestamp, value) pairs.
+
+sync: rows/sec aligning by key with fill="last", against a hand-written
+heapq.merge + groupby version of the same as-of join, and by position against
+itertools.zip_longest.
+
+async: the same feeds arriving at different rates (the third one sleeps every
+SLOW_EVERY items). The fast feeds can only run `buffer` items ahead, so their
+queues and the memory stay bounded; the stats show where the time went. Peak
+memory comes from a second, tracemalloc'd run.
+
+    python align_benchmark.py              # 300_000 items per feed
+    python align_benchmark.py 100000
+"""
+
+import asyncio
+import heapq
+import random
+import sys
+import tracemalloc
+from itertools import groupby, zip_longest
+from operator import itemgetter
+from time import perf_counter
+
+from align import Aligner
+
+SLOW_EVERY = 1_000
+SLOW_SLEEP = 0.001
+
+
+def feed(n, seed):
+    rng = random.Random(seed)
+    timestamp = 0
+    for i in range(n):
+        timestamp += rng.randint(1, 3)
+        yield timestamp, i
+
+
+def tag(i, stream):
+    for item in stream:
+        yield item[0], i, item
+
+
+def merge_groupby(feeds):
+    """As-of join by hand: merge tagged items, group by timestamp, carry the last value."""
+    width = len(feeds)
+    tagged = [tag(i, stream) for i, stream in enumerate(feeds)]
+    last = [None] * width
+    for _, group in groupby(heapq.merge(*tagged), key=itemgetter(0)):
+        for _, i, item in group:
+            last[i] = item
+        yield tuple(last)
+
+
+def timed(label, rows, n):
+    start = perf_counter()
+    rows = list(rows)
+    elapsed = perf_counter() - start
+    count = len(rows)
+    print(f"{label:>28}: {elapsed:7.3f} s  {count / elapsed:11,.0f} rows/s  ({count:,} rows)")
+    return rows
+
+
+async def slow(stream):
+    for i, item in enumerate(stream):
+        if i % SLOW_EVERY == 0:
+            await asyncio.sleep(SLOW_SLEEP)
+        yield item
+
+
+async def fast(stream):
+    for item in stream:
+        yield item
+
+
+def make_aligner(n, buffer):
+    return Aligner(
+        fast(feed(n, 1)), fast(feed(n, 2)), slow(feed(n, 3)),
+        key=itemgetter(0), fill="last", buffer=buffer,
+    )
+
+
+async def drain(aligner):
+    count = 0
+    async for _ in aligner:
+        count += 1
+    return count
+
+
+def run_async(n, buffer):
+    aligner = make_aligner(n, buffer)
+    start = perf_counter()
+    count = asyncio.run(drain(aligner))
+    elapsed = perf_counter() - start
+    tracemalloc.start()
+    asyncio.run(drain(make_aligner(n, buffer)))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"async buffer={buffer}: {count:,} rows in {elapsed:.3f} s, peak {peak / 2**20:.2f} MiB")
+    for i, stats in enumerate(aligner.stats):
+        print(f"    stream {i}: {stats}")
+
+
+def main(n=300_000):
+    print(f"3 feeds x {n:,} items")
+    by_key = timed(
+        "Aligner by key, fill=last",
+        Aligner(feed(n, 1), feed(n, 2), feed(n, 3), key=itemgetter(0), fill="last"),
+        n,
+    )
+    by_hand = timed("heapq.merge + groupby", merge_groupby([feed(n, 1), feed(n, 2), feed(n, 3)]), n)
+    assert by_key == by_hand
+    timed("Aligner by position", Aligner(feed(n, 1), feed(n, 2), feed(n, 3)), n)
+    timed("zip_longest", zip_longest(feed(n, 1), feed(n, 2), feed(n, 3)), n)
+    for buffer in (16, 1024):
+        run_async(n // 10, buffer)
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,112 @@
+"""
+Transposing big matrices without list(zip(*matrix)).
+
+zip(*matrix) passes every row as a separate argument, so all the rows have to be in
+one argument tuple at once, and the result is one tuple per column. Fine for
+[[1, 2, 3], [4, 5, 6]], not for millions of rows. The replacements:
+
+    - transpose(rows): list of lists in, list of column lists out. Rows are taken
+      block_rows at a time (from a list or any iterator of rows), each block is
+      zipped, and its columns are appended to the output columns. Unpacking never
+      involves more than block_rows arguments, and ragged rows raise ValueError
+      instead of being cut short
+    - transpose_array(data, rows, cols): a row-major array.array in, the column-major
+      array.array out. The copy goes tile by tile (block x block elements) so a tile's
+      reads and writes both stay in cache. Within a tile each row (or each column,
+      whichever there are fewer of) is one strided slice assignment in C
+    - transpose_numpy(matrix): the NumPy fast path, a contiguous copy of matrix.T
+    - transpose_to_files(rows, directory): out of core. Rows are streamed in blocks
+      of about max_buffered values, and each block's columns are appended to one file
+      per column, so memory stays bounded whatever the row count. read_column()
+      loads one column file back. Every block opens every column file, so this is
+      for many rows of moderate width; a very wide matrix means that many files
+"""
+
+import os
+from array import array
+from itertools import chain, islice
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def transpose(rows, block_rows=1024):
+    """Columns of rows, as lists."""
+    rows = iter(rows)
+    columns = None
+    while block := list(islice(rows, block_rows)):
+        if columns is None:
+            columns = [[] for _ in block[0]]
+        if any(len(row) != len(columns) for row in block):
+            raise ValueError(f"every row must have {len(columns)} items")
+        for column, values in zip(columns, zip(*block)):
+            column.extend(values)
+    return columns or []
+
+
+def transpose_array(data, rows, cols, block=256):
+    """data holds a rows x cols matrix row by row; return it column by column."""
+    if len(data) != rows * cols:
+        raise ValueError(f"expected {rows} x {cols} = {rows * cols} items, got {len(data)}")
+    out = data[:1] * len(data)
+    for top in range(0, rows, block):
+        bottom = min(top + block, rows)
+        for left in range(0, cols, block):
+            right = min(left + block, cols)
+            if bottom - top <= right - left:
+                # one strided write per row: row i lands at out[j * rows + i]
+                for i in range(top, bottom):
+                    source = i * cols
+                    out[left * rows + i : right * rows : rows] = data[source + left : source + right]
+            else:
+                # one strided read per column: column j comes from data[i * cols + j]
+                for j in range(left, right):
+                    target = j * rows
+                    out[target + top : target + bottom] = data[top * cols + j : bottom * cols : cols]
+    return out
+
+
+def transpose_numpy(matrix):
+    if np is None:
+        raise ImportError("transpose_numpy needs NumPy")
+    return np.ascontiguousarray(np.asarray(matrix).T)
+
+
+def column_path(directory, index):
+    return os.path.join(directory, f"column-{index:06d}.bin")
+
+
+def transpose_to_files(rows, directory, typecode="d", max_buffered=1 << 20):
+    """Stream rows into one binary file per column; return the file paths.
+
+    Each file holds the column's values as array(typecode).tofile writes them. Any
+    files from an earlier run in directory are overwritten.
+    """
+    os.makedirs(directory, exist_ok=True)
+    rows = iter(rows)
+    first = next(rows, None)
+    if first is None:
+        return []
+    width = len(first)
+    paths = [column_path(directory, j) for j in range(width)]
+    for path in paths:
+        open(path, "wb").close()
+
+    block_rows = max(1, max_buffered // width)
+    rows = chain([first], rows)
+    while block := list(islice(rows, block_rows)):
+        if any(len(row) != width for row in block):
+            raise ValueError(f"every row must have {width} items")
+        for path, values in zip(paths, zip(*block)):
+            with open(path, "ab") as out:
+                array(typecode, values).tofile(out)
+    return paths
+
+
+def read_column(path, typecode="d"):
+    column = array(typecode)
+    with open(path, "rb") as source:
+        column.frombytes(source.read())
+    return column
@@ -0,0 +1,58 @@
+"""
+Transposing tall, wide and square matrices of floats: list(zip(*matrix)) against the
+transpose module. Throughput is elements per second; peak is what tracemalloc saw
+allocated during the call (a second run), not counting the input matrix.
+
+    python transpose_benchmark.py             # 1_000_000 elements per shape
+    python transpose_benchmark.py 4000000
+"""
+
+import math
+import random
+import sys
+import tempfile
+import tracemalloc
+from array import array
+from time import perf_counter
+
+from transpose import np, transpose, transpose_array, transpose_numpy, transpose_to_files
+
+
+def shapes(n):
+    side = math.isqrt(n)
+    return {"tall": (n // 4, 4), "wide": (4, n // 4), "square": (side, side)}
+
+
+def cases(matrix, flat, rows, cols, directory):
+    yield "list(zip(*matrix))", lambda: list(zip(*matrix))
+    yield "transpose (lists)", lambda: transpose(matrix)
+    yield "transpose_array", lambda: transpose_array(flat, rows, cols)
+    if np is not None:
+        grid = np.frombuffer(flat, dtype=np.float64).reshape(rows, cols)
+        yield "transpose_numpy", lambda: transpose_numpy(grid)
+    yield "transpose_to_files", lambda: transpose_to_files(iter(matrix), directory)
+
+
+def main(n=1_000_000):
+    rng = random.Random(22)
+    for shape, (rows, cols) in shapes(n).items():
+        matrix = [[rng.random() for _ in range(cols)] for _ in range(rows)]
+        flat = array("d", (value for row in matrix for value in row))
+        print(f"{shape}: {rows:,} x {cols:,}")
+        with tempfile.TemporaryDirectory() as directory:
+            for label, run in cases(matrix, flat, rows, cols, directory):
+                start = perf_counter()
+                run()
+                elapsed = perf_counter() - start
+                tracemalloc.start()
+                run()
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                print(
+                    f"{label:>22}: {elapsed:7.3f} s  {rows * cols / elapsed:13,.0f} elements/s"
+                    f"  peak {peak / 2**20:8.1f} MiB"
+                )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
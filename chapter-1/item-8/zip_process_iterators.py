@@ -42,6 +42,12 @@ for name, count in zip(names, counts):
         max_count = count
 print(longest_name)
 
+# for a long stream of names, zip_reduce.zip_reduce derives the counts and keeps the
+# longest as it goes, in one pass with no counts list. See zip_reduce_benchmark.py
+from zip_reduce import zip_reduce
+
+print(zip_reduce(len, names))  # ('cecilia', 7)
+
 names.append("caroline")
 for name, count in zip(names, counts):
     print(name)  # caroline not in there because tuples are different lengths
@@ -53,6 +59,13 @@ matrix = [[1, 2, 3], [4, 5, 6]]
 transposed = list(zip(*matrix))
 print(transposed)
 
+# zip(*matrix) unpacks every row as an argument, which falls over with millions of
+# rows. transpose.py has blocked, array, NumPy and out-of-core versions.
+# See transpose_benchmark.py
+from transpose import transpose
+
+print(transpose(matrix))  # [[1, 4], [2, 5], [3, 6]]
+
 # # this is what the * is doing
 # def f(a, b, c):
 #     print(a, b, c)
@@ -65,6 +78,14 @@ import itertools
 for name, count in itertools.zip_longest(names, counts):
     print(f"{name}: {count}")
 
+# align.Aligner lines up N iterators (sync or async) by position or by a sort key,
+# filling gaps with a default, the stream's last value, or dropping the row.
+# See align_benchmark.py
+from align import Aligner
+
+for name, count in Aligner(names, counts, fill="last"):
+    print(f"{name}: {count}")  # caroline: 5, repeating marie's count
+
 
 """
 - zip can be used to iterator over multiple iterators in parallel
@@ -0,0 +1,127 @@
+"""
+Streaming zip-map-reduce: one pass, constant memory.
+
+The longest_name example builds counts = [len(n) for n in names] and then zips it
+back with names. For a stream of hundreds of millions of names that intermediate
+list (and names itself, kept around to zip against) is most of the memory.
+zip_reduce derives each value and folds it into the result as the items go by:
+
+    zip_reduce(len, names)                         # ('caroline', 8), like the loop
+    zip_reduce(len, names, reduce="top", k=3)      # [(name, count), ...] longest first
+    zip_reduce(lambda n, w: len(n) * w, names, weights, reduce="sum", strict=True)
+
+    - reduce is "argmax" / "argmin" (the first item with the largest / smallest value,
+      as `if count > max_count` keeps the first), "top" (the k largest, earlier items
+      first on ties) or "sum"
+    - with several iterables, derive gets one item from each, and the item reported
+      for argmax / top is the tuple of them
+    - strict=True raises ValueError when the iterables have different lengths,
+      instead of stopping at the shortest like zip does
+    - chunk_size=N processes the stream in blocks of N through NumPy, when it's
+      installed. derive still runs per item unless vectorized=True, in which case
+      it gets one NumPy array per iterable and returns an array of values. dtype is
+      the values' NumPy dtype (float by default; use an integer dtype for exact sums)
+"""
+
+from heapq import nlargest, nsmallest
+from itertools import islice, starmap, tee
+from operator import itemgetter
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+REDUCTIONS = ("argmax", "argmin", "top", "sum")
+_first = itemgetter(0)
+
+
+def _rows(iterables, strict):
+    if len(iterables) == 1:
+        return iter(iterables[0])
+    return zip(*iterables, strict=strict)
+
+
+def zip_reduce(
+    derive,
+    *iterables,
+    reduce="argmax",
+    k=10,
+    strict=False,
+    chunk_size=None,
+    dtype=float,
+    vectorized=False,
+):
+    if reduce not in REDUCTIONS:
+        raise ValueError(f"reduce must be one of {REDUCTIONS}, not {reduce!r}")
+    if not iterables:
+        raise TypeError("zip_reduce needs at least one iterable")
+    if vectorized and np is None:
+        raise ImportError("vectorized=True needs NumPy")
+    rows = _rows(iterables, strict)
+    if chunk_size and np is not None:
+        return _reduce_chunks(derive, rows, len(iterables), reduce, k, chunk_size, dtype, vectorized)
+
+    if reduce == "sum":
+        return sum(_derive(derive, rows, len(iterables)))
+    rows, items = tee(rows)  # the two copies stay in step, so tee holds one item at most
+    pairs = zip(_derive(derive, rows, len(iterables)), items)
+    if reduce == "top":
+        return [(item, value) for value, item in nlargest(k, pairs, key=_first)]
+    pick = max if reduce == "argmax" else min
+    value, item = pick(pairs, key=_first, default=(None, None))
+    return item, value
+
+
+def _derive(derive, rows, width):
+    return map(derive, rows) if width == 1 else starmap(derive, rows)
+
+
+def _reduce_chunks(derive, rows, width, reduce, k, chunk_size, dtype, vectorized):
+    total = 0
+    best = None  # argmax / argmin: (value, item)
+    top = []  # (value, position in the stream, item), best first
+    seen = 0
+    while chunk := list(islice(rows, chunk_size)):
+        if vectorized:
+            columns = [chunk] if width == 1 else list(zip(*chunk))
+            values = np.asarray(derive(*map(np.asarray, columns)), dtype=dtype)
+        else:
+            values = np.fromiter(_derive(derive, chunk, width), dtype=dtype, count=len(chunk))
+
+        if reduce == "sum":
+            total += values.sum().item()
+        elif reduce == "top":
+            for i in _top_positions(values, k):
+                top.append((values[i].item(), seen + i, chunk[i]))
+            top = nsmallest(k, top, key=lambda entry: (-entry[0], entry[1]))
+        else:
+            i = int(values.argmax() if reduce == "argmax" else values.argmin())
+            value = values[i].item()
+            if (
+                best is None
+                or (reduce == "argmax" and value > best[0])
+                or (reduce == "argmin" and value < best[0])
+            ):
+                best = (value, chunk[i])
+        seen += len(chunk)
+
+    if reduce == "sum":
+        return total
+    if reduce == "top":
+        return [(item, value) for value, _, item in top]
+    if best is None:
+        return None, None
+    return best[1], best[0]
+
+
+def _top_positions(values, k):
+    """Positions of the k largest values, ties going to the earliest positions."""
+    if k <= 0:
+        return []
+    if len(values) <= k:
+        return range(len(values))
+    threshold = np.partition(values, len(values) - k)[len(values) - k]
+    above = np.flatnonzero(values > threshold)
+    at = np.flatnonzero(values == threshold)[: k - len(above)]
+    return np.concatenate((above, at)).tolist()
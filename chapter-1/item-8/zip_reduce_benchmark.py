@@ -0,0 +1,82 @@
+"""
+Longest name in a stream of names: the list comprehension + zip loop from
+zip_process_iterators.py against zip_reduce.
+
+Both start from the same generator of names. The loop has to keep the names in a
+list (to zip them against counts) as well as the counts; zip_reduce looks at each
+name once and keeps nothing. Peak memory comes from a second, tracemalloc'd run.
+
+    python zip_reduce_benchmark.py             # 2_000_000 names
+    python zip_reduce_benchmark.py 10000000
+"""
+
+import sys
+import tracemalloc
+from time import perf_counter
+
+from zip_reduce import np, zip_reduce
+
+POOL = ["cecilia", "lise", "marie", "caroline", "ann", "bo", "christina", "ida"]
+
+
+def stream(n):
+    size = len(POOL)
+    return (POOL[i * 7 % size] + "x" * (i % 5) for i in range(n))
+
+
+def comprehension_zip(names):
+    names = list(names)
+    counts = [len(n) for n in names]
+    longest_name = None
+    max_count = 0
+    for name, count in zip(names, counts):
+        if count > max_count:
+            longest_name = name
+            max_count = count
+    return longest_name, max_count
+
+
+def streaming(names):
+    return zip_reduce(len, names)
+
+
+def top_three(names):
+    return zip_reduce(len, names, reduce="top", k=3)[0]
+
+
+def chunked(names):
+    return zip_reduce(len, names, chunk_size=65_536, dtype="int64")
+
+
+def vectorized(names):
+    return zip_reduce(np.char.str_len, names, chunk_size=65_536, dtype="int64", vectorized=True)
+
+
+def main(n=2_000_000):
+    cases = [
+        ("list comp + zip loop", comprehension_zip),
+        ("zip_reduce argmax", streaming),
+        ("zip_reduce top 3", top_three),
+    ]
+    if np is not None:
+        cases += [("chunked numpy", chunked), ("chunked vectorized", vectorized)]
+    print(f"{n:,} names")
+    expected = comprehension_zip(stream(n))
+    for label, fn in cases:
+        start = perf_counter()
+        result = fn(stream(n))
+        elapsed = perf_counter() - start
+        assert result == expected, (label, result, expected)
+
+        tracemalloc.start()
+        fn(stream(n))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f"{label:>22}: {elapsed:7.3f} s  {n / elapsed:12,.0f} names/s"
+            f"  peak {peak / 2**20:8.2f} MiB"
+        )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,133 @@
+"""
+Coprimality checks built on the greatest common divisor instead of trial division.
+
+Two numbers are coprime when gcd(a, b) == 1. Euclid's algorithm finds the gcd in
+O(log min(a, b)) steps, so this works for 64-bit (or bigger) values where the
+for/else loop in no_else_for_while.py would need billions of iterations.
+
+    - coprime(a, b): one pair, using math.gcd (Euclid, implemented in C)
+    - binary_gcd(a, b): Stein's algorithm in pure Python, for reference
+    - coprime_batch(a, b): element-wise over two sequences
+    - coprime_matrix(values): all pairs of one sequence
+
+The batch forms use NumPy when it is installed and fall back to plain Python
+lists otherwise. NumPy is only imported by the first batch call, since importing it
+takes tens of milliseconds and coprime() alone doesn't need it.
+"""
+
+from math import gcd
+
+np = None  # NumPy or None, once _numpy() has looked
+_numpy_loaded = False
+
+# np.gcd works on fixed-width integers, anything outside int64 stays in Python
+INT64_MIN = -(2**63)
+INT64_MAX = 2**63 - 1
+
+
+def coprime(a, b):
+    return gcd(a, b) == 1
+
+
+def binary_gcd(a, b):
+    """Stein's algorithm: only shifts, subtraction and parity checks."""
+    a = abs(a)
+    b = abs(b)
+    if a == 0:
+        return b
+    if b == 0:
+        return a
+
+    # the power of two both numbers share
+    shift = ((a | b) & -(a | b)).bit_length() - 1
+    a >>= (a & -a).bit_length() - 1
+    while b:
+        b >>= (b & -b).bit_length() - 1
+        if a > b:
+            a, b = b, a
+        b -= a
+    return a << shift
+
+
+def _numpy():
+    global np, _numpy_loaded
+    if not _numpy_loaded:
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+        _numpy_loaded = True
+    return np
+
+
+def _fits_int64(values):
+    # only real ints: np.asarray(dtype=int64) would truncate 3.5 to 3 where
+    # math.gcd raises TypeError, so anything else is left to the Python path
+    return all(isinstance(v, int) and INT64_MIN <= v <= INT64_MAX for v in values)
+
+
+def _sequence(values):
+    """values in a form that can be read twice: ndarrays as they are, else a list."""
+    if np is not None and isinstance(values, np.ndarray):
+        return values
+    return values if isinstance(values, list) else list(values)
+
+
+def _as_int64(values):
+    """values (from _sequence) as an integer ndarray, or None for the Python path."""
+    if np is None:
+        return None
+    if isinstance(values, np.ndarray):
+        if values.dtype.kind == "i":
+            return values
+        if values.dtype.kind == "u" and not (values.size and values.max() > INT64_MAX):
+            return values.astype(np.int64)  # np.gcd of uint64 with int64 isn't defined
+        return None
+    if not _fits_int64(values):
+        return None
+    return np.asarray(values, dtype=np.int64)
+
+
+def _as_list(values):
+    return values.tolist() if np is not None and isinstance(values, np.ndarray) else values
+
+
+def coprime_batch(a, b):
+    """Element-wise coprime(a[i], b[i]).
+
+    Returns a NumPy bool array when NumPy is available and the values fit in
+    int64, otherwise a list of bools. Raises ValueError if the lengths differ.
+    """
+    _numpy()
+    a = _sequence(a)
+    b = _sequence(b)
+    if len(a) != len(b):
+        raise ValueError(f"length mismatch: {len(a)} != {len(b)}")
+    left = _as_int64(a)
+    right = _as_int64(b) if left is not None else None
+    if left is not None and right is not None:
+        return np.gcd(left, right) == 1
+    return [gcd(x, y) == 1 for x, y in zip(_as_list(a), _as_list(b))]
+
+
+def coprime_matrix(values):
+    """All-pairs check: result[i][j] is coprime(values[i], values[j]).
+
+    With NumPy this is one np.gcd.outer call. The pure-Python fallback only
+    computes the upper triangle and mirrors it, since gcd is symmetric.
+    """
+    _numpy()
+    values = _sequence(values)
+    array = _as_int64(values)
+    if array is not None:
+        return np.gcd.outer(array, array) == 1
+
+    values = _as_list(values)
+    n = len(values)
+    result = [[False] * n for _ in range(n)]
+    for i, x in enumerate(values):
+        row = result[i]
+        row[i] = x in (1, -1)
+        for j in range(i + 1, n):
+            row[j] = result[j][i] = gcd(x, values[j]) == 1
+    return result
@@ -0,0 +1,52 @@
+"""
+Compare the trial-division coprime loop from no_else_for_while.py with the
+gcd-based functions in coprime.py.
+
+    python coprime_benchmark.py              # 10^5 pairs, 2000-value matrix
+    python coprime_benchmark.py 10000 500    # pairs, matrix size
+"""
+
+import random
+import sys
+from time import perf_counter
+
+import coprime
+
+
+def trial_division(a, b):
+    for i in range(2, min(a, b) + 1):
+        if a % i == 0 and b % i == 0:
+            return False
+    return True
+
+
+def timed(label, fn, count):
+    start = perf_counter()
+    result = fn()
+    elapsed = perf_counter() - start
+    print(f"{label:>28}: {elapsed:9.4f} s  {count / elapsed:14,.0f} checks/s")
+    return result
+
+
+def main(pairs=100_000, matrix_size=2_000):
+    backend = "numpy" if coprime._numpy() is not None else "pure python"
+    print(f"batch backend: {backend}")
+
+    # trial division is O(min(a, b)) per pair, so keep its inputs small
+    small = [(random.randint(1, 10_000), random.randint(1, 10_000)) for _ in range(2_000)]
+    expected = timed("trial division (<=10^4)", lambda: [trial_division(a, b) for a, b in small], len(small))
+    got = timed("coprime (<=10^4)", lambda: [coprime.coprime(a, b) for a, b in small], len(small))
+    assert got == expected
+
+    a = [random.getrandbits(62) for _ in range(pairs)]
+    b = [random.getrandbits(62) for _ in range(pairs)]
+    timed("coprime loop (62-bit)", lambda: [coprime.coprime(x, y) for x, y in zip(a, b)], pairs)
+    timed("binary_gcd loop (62-bit)", lambda: [coprime.binary_gcd(x, y) == 1 for x, y in zip(a, b)], pairs)
+    timed("coprime_batch (62-bit)", lambda: coprime.coprime_batch(a, b), pairs)
+
+    values = [random.getrandbits(32) for _ in range(matrix_size)]
+    timed(f"coprime_matrix ({matrix_size}^2)", lambda: coprime.coprime_matrix(values), matrix_size**2)
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
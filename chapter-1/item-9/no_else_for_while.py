@@ -76,11 +76,26 @@ def coprime_alternate(a, b):
         if a % i == 0 and b % i == 0:
             is_coprime = False
             break
-    return coprime
+    return is_coprime
 
 
-assert coprime(4, 9)
-assert not coprime(3, 6)
+assert coprime_alternate(4, 9)
+assert not coprime_alternate(3, 6)
+
+
+"""
+Both versions test every number from 2 to min(a, b), which is hopeless for 64-bit
+values. Two numbers are coprime exactly when their greatest common divisor is 1, and
+Euclid's algorithm gets the gcd in O(log n) steps. coprime.py builds on that, with a
+batch form over two arrays and an all-pairs coprime_matrix (NumPy when available).
+See coprime_benchmark.py
+"""
+import coprime as fast
+
+assert fast.coprime(4, 9)
+assert not fast.coprime(3, 6)
+assert fast.coprime(2**61 - 1, 2**64 - 1)
+print(list(fast.coprime_batch([4, 3, 10], [9, 6, 21])))  # [True, False, True]
 
 
 """Notes:
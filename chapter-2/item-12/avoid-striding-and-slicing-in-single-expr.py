@@ -18,7 +18,7 @@ logging.info("Starting basic stride examples")
 
 x = ["red", "orange", "yellow", "green", "blue", "purple"]
 print(f"Original list: {x}")
-logging.info(f"Created list with {len(x)} elements: {x}")
+logging.info("Created list with %d elements: %s", len(x), x)
 
 logging.info("Performing x[::2] to get every 2nd element starting from index 0")
 odds = x[::2]
@@ -27,7 +27,7 @@ evens = x[1::2]
 
 print(f"Every 2nd element starting from index 0 (x[::2]): {odds}")
 print(f"Every 2nd element starting from index 1 (x[1::2]): {evens}")
-logging.info(f"Results - odds: {len(odds)} elements, evens: {len(evens)} elements")
+logging.info("Results - odds: %d elements, evens: %d elements", len(odds), len(evens))
 
 """
 problem is that the stride syntax often causes unexpected behavior that can
@@ -43,14 +43,14 @@ print(f"Original byte string: {x}")
 logging.info("Using [::-1] on byte string to reverse")
 y = x[::-1]
 print(f"Reversed with [::-1]: {y}")
-logging.info(f"Byte string reversed: {x} -> {y}")
+logging.info("Byte string reversed: %s -> %s", x, y)
 
 x = "apple"
 print(f"Original string: '{x}'")
 logging.info("Using [::-1] on regular string to reverse")
 y = x[::-1]
 print(f"Reversed with [::-1]: '{y}'")
-logging.info(f"String reversed: '{x}' -> '{y}'")
+logging.info("String reversed: '%s' -> '%s'", x, y)
 
 # w = "無無"
 # x = w.encode("utf-8")
@@ -62,7 +62,7 @@ logging.info("Starting complex stride examples - these can be confusing!")
 
 x = ["a", "b", "c", "d", "e", "f", "g", "h"]
 print(f"Original list: {x}")
-logging.info(f"Working with list of {len(x)} elements: {x}")
+logging.info("Working with list of %d elements: %s", len(x), x)
 
 logging.info("Executing x[::2] - start at beginning, no end specified, step by 2")
 result1 = x[::2]
@@ -102,5 +102,30 @@ print(f"Step 1 - Extract every 2nd element: {y}")
 logging.info("Step 2: Remove first and last elements using y[1:-1]")
 z = y[1:-1]
 print(f"Step 2 - Remove first and last elements: {z}")
-logging.info(f"Final result after 2 clear steps: {z}")
+logging.info("Final result after 2 clear steps: %s", z)
 logging.info("This approach is much clearer than a single complex slice expression!")
+
+"""
+The f-strings passed to logging.info above were built even when INFO is off. The calls
+now pass %-style arguments, which logging only formats if the record is emitted.
+For slicing inside hot loops, slice_log.SliceLog checks isEnabledFor first, can log
+1 in N slices, or just count slices and time per shape. See slice_log_benchmark.py
+"""
+from slice_log import SliceLog
+
+counted = SliceLog(mode="counters")
+for _ in range(1000):
+    y = counted[x, ::2]
+    z = counted[y, 1:-1]
+counted.emit()
+
+"""
+The two clear steps above still copy twice. seq_view.SeqView keeps the steps but
+slices lazily: a view of a view is one view over x, and nothing is copied until
+materialize() (or zero copies at all, through memoryview() for bytes and arrays).
+See seq_view_benchmark.py
+"""
+from seq_view import SeqView
+
+z = SeqView(x)[::2][1:-1]
+print(f"SeqView steps: {z!r} -> {z.materialize()}")
@@ -0,0 +1,84 @@
+"""
+Lazy start:stop:stride views, so chained slices don't copy.
+
+y = x[::2] followed by z = y[1:-1] is the clear, two-step way to write x[2:-1:2]
+(or whatever the combination works out to), but it copies the data twice. A
+SeqView only records which indices of the underlying list, bytes or array it
+covers, as a range, and slicing a range gives another range. So:
+
+    - slicing a view gives a new view over the same base; a view of a view is
+      still a single view, however many slices were chained
+    - indexing and iterating read straight from the base. A view over a list shows
+      later changes to that list, like a memoryview does for a bytearray
+    - materialize() copies once, into the base's own type, with one slice
+    - for bytes, bytearray, array.array and anything else with the buffer protocol,
+      memoryview() gives a zero-copy memoryview of the same elements. Iterating a
+      view of bytes, bytearray or array goes through one too (so a bytearray can't
+      be resized while it's being iterated)
+
+    z = SeqView(x)[::2][1:-1]
+    z[0], len(z), sum(z)       # no copies
+    z.materialize()            # == x[::2][1:-1], one copy
+"""
+
+from array import array
+from collections.abc import Sequence
+
+
+class SeqView(Sequence):
+    __slots__ = ("base", "_range")
+
+    def __init__(self, base, item=slice(None)):
+        if isinstance(base, SeqView):
+            indices = base._range[item]
+            base = base.base
+        else:
+            indices = range(len(base))[item]
+        self.base = base
+        self._range = indices
+
+    def _slice(self):
+        """The one slice of base this view covers."""
+        indices = self._range
+        if not indices:
+            return slice(0, 0)  # an empty range's start can be anywhere, even negative
+        # a negative stop from range means "past index 0", which a slice spells None
+        stop = indices.stop if indices.stop >= 0 else None
+        return slice(indices.start, stop, indices.step)
+
+    def __len__(self):
+        return len(self._range)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return SeqView(self, item)
+        return self.base[self._range[item]]
+
+    def __iter__(self):
+        base = self.base
+        if isinstance(base, (bytes, bytearray)) or (
+            isinstance(base, array) and base.typecode not in "uw"
+        ):
+            return iter(self.memoryview())  # C-level strided walk over the buffer
+        return map(base.__getitem__, self._range)
+
+    def __reversed__(self):
+        return map(self.base.__getitem__, reversed(self._range))
+
+    def __contains__(self, value):
+        return any(item is value or item == value for item in self)
+
+    def materialize(self):
+        """Copy the elements into a new object of the base's type (list, bytes, ...)."""
+        return self.base[self._slice()]
+
+    def memoryview(self):
+        """A zero-copy memoryview of the elements. The base must support the buffer protocol."""
+        return memoryview(self.base)[self._slice()]
+
+    def __repr__(self):
+        indices = self._range
+        return (
+            f"SeqView({type(self.base).__name__}, "
+            f"range({indices.start}, {indices.stop}, {indices.step}), len={len(indices)})"
+        )
@@ -0,0 +1,82 @@
+"""
+The chained-slice pattern from avoid-striding-and-slicing-in-single-expr.py,
+y = x[::2] then z = y[1:-1], on large inputs: copying slices against SeqView.
+
+    copies        z = x[::2][1:-1]                 two copies
+    view          SeqView(x)[::2][1:-1]            no copy
+    materialize   SeqView(x)[::2][1:-1].materialize()   one copy
+    memoryview    SeqView(b)[::2][1:-1].memoryview()    no copy (bytes/array only)
+
+Each is timed building z alone, and building z and then summing it. Also printed:
+the memory tracemalloc saw allocated at the peak while building z.
+
+    python seq_view_benchmark.py              # 10_000_000 elements
+    python seq_view_benchmark.py 1000000
+"""
+
+import sys
+import tracemalloc
+from array import array
+from time import perf_counter
+
+from seq_view import SeqView
+
+
+def copies(x):
+    y = x[::2]
+    return y[1:-1]
+
+
+def view(x):
+    return SeqView(x)[::2][1:-1]
+
+
+def materialize(x):
+    return view(x).materialize()
+
+
+def buffer(x):
+    return view(x).memoryview()
+
+
+def timed(fn, x, consume):
+    start = perf_counter()
+    z = fn(x)
+    if consume:
+        sum(z)
+    return perf_counter() - start
+
+
+def peak_memory(fn, x):
+    """Bytes allocated at the peak while building z (timed separately: tracing is slow)."""
+    tracemalloc.start()
+    z = fn(x)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main(n=10_000_000):
+    inputs = {
+        "list": list(range(n)),
+        "bytes": bytes(i % 256 for i in range(n)),
+        "array('q')": array("q", range(n)),
+    }
+    for kind, x in inputs.items():
+        print(f"{kind}, {n:,} elements: x[::2][1:-1]")
+        cases = [("copies", copies), ("view", view), ("materialize", materialize)]
+        if kind != "list":
+            cases.append(("memoryview", buffer))
+        expected = sum(copies(x))
+        for label, fn in cases:
+            assert sum(fn(x)) == expected
+            built = timed(fn, x, consume=False)
+            elapsed = timed(fn, x, consume=True)
+            print(
+                f"{label:>14}: build {built * 1000:9.3f} ms  build+sum {elapsed * 1000:8.1f} ms"
+                f"  peak {peak_memory(fn, x) / 2**20:7.1f} MiB"
+            )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,134 @@
+"""
+Cheap instrumentation for slicing in hot loops.
+
+logging.info(f"... {x} ...") builds the message before logging even checks the level,
+so with INFO turned off each call still pays for the f-string (and the repr of x).
+SliceLog does the slice and records it in one of four modes:
+
+    - "log": one record per slice. The level is checked with isEnabledFor first, and
+      the message uses %-style arguments, so nothing is formatted unless a handler
+      actually emits the record
+    - "sample": the same record, for 1 in every `every` slices
+    - "counters": no records at all. Per slice shape (or label) it keeps the number
+      of slices, the time spent and the items produced; summary() returns them and
+      emit() logs them once at the end
+    - "off": just the slice
+
+Only slices are recorded; any other item (seq[3], a dict key) is looked up and
+returned without touching the log or the counters, in every mode.
+
+    log = SliceLog(mode="sample", every=1000)
+    odds = log[x, ::2]                 # same as x[::2]
+    evens = log.take(x, slice(1, None, 2), label="evens")
+"""
+
+import logging
+from time import perf_counter_ns
+
+MODES = ("log", "sample", "counters", "off")
+
+
+class _SliceText:
+    """Renders a slice as it's written (::2, 1:-1) when, and only if, it's formatted."""
+
+    __slots__ = ("item",)
+
+    def __init__(self, item):
+        self.item = item
+
+    def __str__(self):
+        return slice_text(self.item)
+
+
+def slice_text(item):
+    if not isinstance(item, slice):
+        return repr(item)
+    start = "" if item.start is None else item.start
+    stop = "" if item.stop is None else item.stop
+    if item.step is None:
+        return f"{start}:{stop}"
+    return f"{start}:{stop}:{item.step}"
+
+
+class SliceLog:
+    def __init__(self, logger=None, level=logging.INFO, mode="log", every=100):
+        if mode not in MODES:
+            raise ValueError(f"mode must be one of {MODES}, not {mode!r}")
+        if every < 1:
+            raise ValueError("every must be at least 1")
+        self.logger = logger or logging.getLogger(__name__)
+        self.level = level
+        self.mode = mode
+        self.every = every
+        self.ops = 0
+        self.counters = {}  # label or (start, stop, step) -> [slices, ns, items]
+
+    def take(self, seq, item, label=None):
+        """seq[item], recorded according to the mode."""
+        if not isinstance(item, slice):
+            return seq[item]
+        mode = self.mode
+        if mode == "counters":
+            start = perf_counter_ns()
+            result = seq[item]
+            elapsed = perf_counter_ns() - start
+            key = label or (item.start, item.stop, item.step)
+            entry = self.counters.get(key)
+            if entry is None:
+                entry = self.counters[key] = [0, 0, 0]
+            entry[0] += 1
+            entry[1] += elapsed
+            entry[2] += len(result)
+            return result
+
+        result = seq[item]
+        if mode == "off":
+            return result
+        self.ops += 1
+        if mode == "sample" and self.ops % self.every:
+            return result
+        if self.logger.isEnabledFor(self.level):
+            self.logger.log(
+                self.level,
+                "%s[%s] -> %d of %d items",
+                label or type(seq).__name__,
+                _SliceText(item),
+                len(result),
+                len(seq),
+            )
+        return result
+
+    def __getitem__(self, args):
+        seq, item = args
+        return self.take(seq, item)
+
+    def summary(self):
+        """Counters per slice shape, most time first."""
+        rows = [
+            {
+                "slice": key if isinstance(key, str) else slice_text(slice(*key)),
+                "count": count,
+                "seconds": ns / 1e9,
+                "items": items,
+            }
+            for key, (count, ns, items) in self.counters.items()
+        ]
+        return sorted(rows, key=lambda row: -row["seconds"])
+
+    def emit(self):
+        """Log the counters, one record per slice shape."""
+        if not self.logger.isEnabledFor(self.level):
+            return
+        for row in self.summary():
+            self.logger.log(
+                self.level,
+                "[%s] x%d, %.6f s, %d items",
+                row["slice"],
+                row["count"],
+                row["seconds"],
+                row["items"],
+            )
+
+    def reset(self):
+        self.ops = 0
+        self.counters.clear()
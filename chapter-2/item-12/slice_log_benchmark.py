@@ -0,0 +1,102 @@
+"""
+Cost of logging around every x[::2] slice, with logging disabled, at INFO (written to
+os.devnull, so the handler's formatting is counted but not a terminal) and sampled.
+
+    eager f-string   logging.info(f"... {x} ...") as in the stride examples
+    deferred         logging.info("... %s ...", x)
+    guarded          if logger.isEnabledFor(INFO): logger.info("... %s ...", x)
+    SliceLog         slice_log.SliceLog in each mode
+
+    python slice_log_benchmark.py              # 1_000_000 slices disabled, 100_000 at INFO
+    python slice_log_benchmark.py 200000 20000
+"""
+
+import logging
+import os
+import sys
+from time import perf_counter
+
+from slice_log import SliceLog
+
+X = ["a", "b", "c", "d", "e", "f", "g", "h"]
+
+
+def plain(logger, n):
+    x = X
+    for _ in range(n):
+        x[::2]
+
+
+def eager(logger, n):
+    x = X
+    for _ in range(n):
+        logger.info(f"Executing x[::2] on {len(x)} elements: {x}")
+        x[::2]
+
+
+def deferred(logger, n):
+    x = X
+    for _ in range(n):
+        logger.info("Executing x[::2] on %d elements: %s", len(x), x)
+        x[::2]
+
+
+def guarded(logger, n):
+    x = X
+    for _ in range(n):
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Executing x[::2] on %d elements: %s", len(x), x)
+        x[::2]
+
+
+def slice_log(mode, **options):
+    def run(logger, n):
+        log = SliceLog(logger, mode=mode, **options)
+        x = X
+        every_other = slice(None, None, 2)
+        for _ in range(n):
+            log.take(x, every_other)
+        if mode == "counters":
+            log.emit()
+
+    return run
+
+
+CASES = [
+    ("no logging", plain),
+    ("eager f-string", eager),
+    ("deferred %-args", deferred),
+    ("isEnabledFor guard", guarded),
+    ("SliceLog log", slice_log("log")),
+    ("SliceLog sample 1/100", slice_log("sample", every=100)),
+    ("SliceLog counters", slice_log("counters")),
+    ("SliceLog off", slice_log("off")),
+]
+
+
+def make_logger():
+    logger = logging.getLogger("slice_log_benchmark")
+    logger.propagate = False
+    handler = logging.FileHandler(os.devnull)
+    handler.setFormatter(
+        logging.Formatter("%(asctime)s - %(levelname)s - %(message)s", datefmt="%H:%M:%S")
+    )
+    logger.addHandler(handler)
+    return logger, handler
+
+
+def main(disabled=1_000_000, enabled=100_000):
+    logger, handler = make_logger()
+    for level, n in ((logging.WARNING, disabled), (logging.INFO, enabled)):
+        logger.setLevel(level)
+        print(f"logger at {logging.getLevelName(level)}, {n:,} slices")
+        for label, run in CASES:
+            start = perf_counter()
+            run(logger, n)
+            elapsed = perf_counter() - start
+            print(f"{label:>24}: {elapsed:7.3f} s  {elapsed / n * 1e9:8.0f} ns/slice")
+    handler.close()
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
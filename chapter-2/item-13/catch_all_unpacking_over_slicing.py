@@ -58,6 +58,20 @@ for row in generate_csv():
 header, *rows = generate_csv()
 print(f"Header: {header}, Rows: {rows}")
 
+"""
+The starred part of header, *rows always becomes a list, so every row of the file is
+held in memory at once. For big exports, csv_stream.stream_csv splits off the header
+the same way but keeps the rows as a lazy iterator (or batches of N rows), so memory
+stays flat no matter how big the input is. See csv_stream_benchmark.py
+"""
+from csv_stream import CsvStream, stream_csv
+
+header, rows = stream_csv(generate_csv())
+print(f"Header: {header}, Rows: {list(rows)}")
+
+for batch in CsvStream(generate_csv()).batches(1):
+    print(batch)
+
 
 """
 Unpacking assignments may use a starred expression to catch all values that
@@ -0,0 +1,110 @@
+"""
+Streaming reader for header + rows data.
+
+header, *rows = generate_csv() is neat, but the starred target is always a list, so
+every row ends up in memory at once. CsvStream takes the header off the front and
+then hands out the body lazily, one row (or one batch of rows) at a time, so peak
+memory depends on the batch size and not on the size of the file.
+
+The source can be a path, an open text file or any iterable of rows such as
+generate_csv(). A path is reopened for every pass over the stream; a file or an
+iterator can only be read once, like any other iterator. Rows are tuples, optionally converted column by column with types;
+with types, a row whose length doesn't match the header raises ValueError.
+"""
+
+import csv
+from itertools import islice
+
+
+class CsvStream:
+    def __init__(self, source, types=None, **reader_options):
+        self._file = None
+        self._path = None
+        self._reader_options = reader_options
+        if isinstance(source, str):
+            self._path = source
+            source = self._open()
+        elif hasattr(source, "read"):
+            source = csv.reader(source, **reader_options)
+
+        self._rows = iter(source)
+        try:
+            self.header = tuple(next(self._rows))
+        except StopIteration:
+            self.header = ()
+
+        try:
+            self._converters = self._build_converters(types)
+        except Exception:
+            self.close()
+            raise
+
+    def _build_converters(self, types):
+        if types is None:
+            return None
+        if isinstance(types, dict):
+            unknown = set(types) - set(self.header)
+            if unknown:
+                raise KeyError(f"unknown columns: {sorted(unknown)}")
+            types = [types.get(name) for name in self.header]
+        if len(types) != len(self.header):
+            raise ValueError(f"expected {len(self.header)} types, got {len(types)}")
+        return tuple(types)
+
+    def _open(self):
+        self._file = open(self._path, newline="")
+        return csv.reader(self._file, **self._reader_options)
+
+    def _convert(self, row):
+        return tuple(
+            value if convert is None else convert(value)
+            for convert, value in zip(self._converters, row)
+        )
+
+    def __iter__(self):
+        rows = self._rows
+        if self._file is None and self._path is not None:
+            # an earlier pass closed the file: start again after the header
+            rows = self._rows = self._open()
+            next(rows, None)
+        try:
+            if self._converters is None:
+                for row in rows:
+                    yield tuple(row)
+            else:
+                convert = self._convert
+                width = len(self._converters)
+                # row 1 is the header
+                for number, row in enumerate(rows, 2):
+                    if len(row) != width:
+                        raise ValueError(
+                            f"row {number} has {len(row)} fields, the header has {width}"
+                        )
+                    yield convert(row)
+        finally:
+            self.close()
+
+    def batches(self, size):
+        """Yield lists of up to size rows for bulk processing."""
+        if size < 1:
+            raise ValueError("batch size must be at least 1")
+        rows = iter(self)
+        while batch := list(islice(rows, size)):
+            yield batch
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def stream_csv(source, types=None, **reader_options):
+    """Streaming version of header, *rows = source: returns (header, row iterator)."""
+    stream = CsvStream(source, types, **reader_options)
+    return stream.header, iter(stream)
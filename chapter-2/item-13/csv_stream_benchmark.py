@@ -0,0 +1,97 @@
+"""
+Peak memory and time of header, *rows = list(...) versus CsvStream, on a CSV file
+and on a generator like generate_csv, at growing row counts.
+
+The streaming peak should stay flat as the input grows while the list version
+grows with it.
+
+    python csv_stream_benchmark.py                # 10^4 .. 10^6 rows
+    python csv_stream_benchmark.py 100000         # stop at 10^5 rows
+"""
+
+import csv
+import os
+import sys
+import tempfile
+import tracemalloc
+from time import perf_counter
+
+from csv_stream import CsvStream
+
+TYPES = (str, str, str, int, int)
+
+
+def generate_csv(count):
+    yield ("Date", "Make", "Model", "year", "price")
+    for i in range(count):
+        yield ("2024-01-01", "Toyota", "Camry", 2000 + i % 25, 20000 + i % 5000)
+
+
+def write_csv(path, count):
+    with open(path, "w", newline="") as f:
+        csv.writer(f).writerows(generate_csv(count))
+
+
+def total_price_list(source):
+    header, *rows = list(source)
+    return sum(row[4] for row in rows)
+
+
+def total_price_stream(source):
+    return sum(row[4] for row in CsvStream(source))
+
+
+def total_price_batches(source, size=1_000):
+    return sum(row[4] for batch in CsvStream(source).batches(size) for row in batch)
+
+
+def total_price_list_file(path):
+    with open(path, newline="") as f:
+        header, *rows = list(csv.reader(f))
+    return sum(int(row[4]) for row in rows)
+
+
+def total_price_stream_file(path):
+    return sum(row[4] for row in CsvStream(path, types=TYPES))
+
+
+def measure(fn, *args):
+    tracemalloc.start()
+    start = perf_counter()
+    result = fn(*args)
+    elapsed = perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main(max_rows=1_000_000):
+    print(f"{'rows':>9} {'source':>9} {'approach':>20} {'time s':>8} {'peak MiB':>9}")
+    rows = 10_000
+    path = os.path.join(tempfile.mkdtemp(), "cars.csv")
+    try:
+        while rows <= max_rows:
+            cases = [
+                ("generator", "header, *rows", total_price_list, generate_csv(rows)),
+                ("generator", "CsvStream", total_price_stream, generate_csv(rows)),
+                ("generator", "CsvStream.batches", total_price_batches, generate_csv(rows)),
+            ]
+            write_csv(path, rows)
+            cases += [
+                ("file", "header, *rows", total_price_list_file, path),
+                ("file", "CsvStream", total_price_stream_file, path),
+            ]
+            totals = set()
+            for source, label, fn, arg in cases:
+                total, elapsed, peak = measure(fn, arg)
+                totals.add(total)
+                print(f"{rows:>9} {source:>9} {label:>20} {elapsed:>8.3f} {peak / 2**20:>9.2f}")
+            assert len(totals) == 1
+            rows *= 10
+    finally:
+        os.remove(path)
+        os.rmdir(os.path.dirname(path))
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,161 @@
+"""
+Column-oriented storage for sorting lots of records by several fields.
+
+purchases.sort(key=lambda x: (x.description, x.cost)) calls a Python function and
+builds a tuple for every element on every sort. Columns keeps each field in its own
+list instead, and sorts a permutation of row numbers:
+
+    - with NumPy, np.lexsort over the column arrays
+    - without it, one stable list.sort per key, least significant key first, using
+      the column's own __getitem__ as the key function (no lambda, no tuples)
+
+Each key can be ascending or descending on its own ("cost" vs "-cost"), so
+mixed orders don't need the reverse=True trick that flips every key at once.
+The result is a RowView over the original columns, nothing gets copied or
+re-sorted. Sort orders are cached until append() changes the table; the columns
+property is a read-only snapshot, so nothing else can change them behind the cache.
+"""
+
+from types import MappingProxyType
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class RowView:
+    """Read-only rows of a Columns table in the order of a permutation."""
+
+    def __init__(self, table, order):
+        self.table = table
+        self.order = order
+
+    def __len__(self):
+        return len(self.order)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return RowView(self.table, self.order[index])
+        return self.table.row(int(self.order[index]))
+
+    def __iter__(self):
+        row = self.table.row
+        for i in self.order:
+            yield row(int(i))
+
+    def column(self, name):
+        """One column in view order."""
+        values = self.table._columns[name]
+        if np is not None and isinstance(self.order, np.ndarray):
+            return np.asarray(values)[self.order]
+        return [values[i] for i in self.order]
+
+    def objects(self):
+        """The source objects in view order, for tables built with from_objects."""
+        objects = self.table.objects
+        if objects is None:
+            raise ValueError("table was not built from objects")
+        return [objects[i] for i in self.order]
+
+    def __repr__(self):
+        return f"RowView({list(self)!r})"
+
+
+class Columns:
+    def __init__(self, **columns):
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"columns have different lengths: {sorted(lengths)}")
+        self._columns = {name: list(values) for name, values in columns.items()}
+        self._snapshot = None
+        self.objects = None
+        self._orders = {}
+
+    @property
+    def columns(self):
+        """{name: tuple of values}, read-only; change the table with append()."""
+        if self._snapshot is None:
+            self._snapshot = MappingProxyType(
+                {name: tuple(values) for name, values in self._columns.items()}
+            )
+        return self._snapshot
+
+    @classmethod
+    def from_objects(cls, objects, *fields):
+        objects = list(objects)
+        table = cls(**{name: [getattr(obj, name) for obj in objects] for name in fields})
+        table.objects = objects
+        return table
+
+    def __len__(self):
+        return len(next(iter(self._columns.values()), ()))
+
+    def row(self, index):
+        return tuple(values[index] for values in self._columns.values())
+
+    def append(self, obj=None, **values):
+        if obj is not None:
+            values = {name: getattr(obj, name) for name in self._columns}
+        elif self.objects is not None:
+            raise ValueError("table was built from objects: append the object itself")
+        if values.keys() != self._columns.keys():
+            raise ValueError(f"expected columns {list(self._columns)}")
+        for name, value in values.items():
+            self._columns[name].append(value)
+        if self.objects is not None:
+            self.objects.append(obj)
+        self._orders.clear()
+        self._snapshot = None
+
+    def _parse_keys(self, keys):
+        parsed = []
+        for key in keys:
+            descending = key.startswith("-")
+            name = key[1:] if descending else key
+            if name not in self._columns:
+                raise KeyError(name)
+            parsed.append((name, descending))
+        return tuple(parsed)
+
+    def argsort(self, *keys):
+        """Row numbers ordered by keys, e.g. argsort("weight", "-name").
+
+        Results are cached per key combination until the table changes.
+        """
+        parsed = self._parse_keys(keys)
+        order = self._orders.get(parsed)
+        if order is None:
+            if np is not None:
+                order = self._argsort_numpy(parsed)
+            else:
+                order = self._argsort_python(parsed)
+            self._orders[parsed] = order
+        return order
+
+    def _argsort_python(self, parsed):
+        order = list(range(len(self)))
+        for name, descending in reversed(parsed):
+            order.sort(key=self._columns[name].__getitem__, reverse=descending)
+        return order
+
+    def _argsort_numpy(self, parsed):
+        arrays = []
+        # np.lexsort treats the last array as the primary key
+        for name, descending in reversed(parsed):
+            values = np.asarray(self._columns[name])
+            if descending:
+                # flip the order without changing which values tie, so rows with
+                # equal keys keep their order like list.sort(reverse=True) does.
+                # ~x is -x - 1, which can't overflow the way -x does at INT64_MIN
+                if values.dtype.kind in "iub":
+                    values = ~values
+                elif values.dtype.kind == "f":
+                    values = -values
+                else:
+                    values = -np.unique(values, return_inverse=True)[1]
+            arrays.append(values)
+        return np.lexsort(arrays)
+
+    def sorted(self, *keys):
+        return RowView(self, self.argsort(*keys))
@@ -0,0 +1,61 @@
+"""
+Sort a catalog of Purchase objects with key lambdas versus Columns.argsort, for
+a few ascending/descending key combinations.
+
+    python columnar_benchmark.py             # 10^6 purchases
+    python columnar_benchmark.py 100000
+"""
+
+import random
+import sys
+from time import perf_counter
+
+from columnar import Columns, np
+
+
+class Purchase:
+    def __init__(self, description, cost):
+        self.description = description
+        self.cost = cost
+
+
+WORDS = ["uber", "clothes", "ai", "gim", "coffee", "books", "rent", "games"]
+
+# keys for Columns.argsort and the equivalent key function for list.sort
+CASES = [
+    (("description", "cost"), lambda x: (x.description, x.cost)),
+    (("cost",), lambda x: x.cost),
+    (("-cost", "description"), lambda x: (-x.cost, x.description)),
+]
+
+
+def timed(fn):
+    start = perf_counter()
+    result = fn()
+    return result, perf_counter() - start
+
+
+def main(size=1_000_000):
+    purchases = [
+        Purchase(f"{random.choice(WORDS)}-{random.randrange(1000)}", random.randrange(10_000))
+        for _ in range(size)
+    ]
+    table, build = timed(lambda: Columns.from_objects(purchases, "description", "cost"))
+    backend = "numpy lexsort" if np is not None else "stable list.sort passes"
+    print(f"{size} purchases, Columns built in {build:.3f} s, backend: {backend}")
+
+    for keys, key_fn in CASES:
+        objects = list(purchases)
+        _, by_lambda = timed(lambda: objects.sort(key=key_fn))
+        table._orders.clear()
+        view, by_columns = timed(lambda: table.sorted(*keys))
+        _, cached = timed(lambda: table.sorted(*keys))
+        assert view.objects() == objects
+        print(
+            f"{', '.join(keys):>20}: lambda {by_lambda:.3f} s  "
+            f"columns {by_columns:.3f} s  cached {cached * 1e6:.1f} us"
+        )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,115 @@
+"""
+Compact versions of the Tool and Purchase classes from sort_using_key_param.py.
+
+A plain class keeps its attributes in a per-instance __dict__, which costs more
+memory than the values themselves once there are millions of instances.
+
+    - SlottedTool / SlottedPurchase: same constructor and __repr__, but __slots__
+      stores the attributes in fixed slots on the instance, with no __dict__
+    - ToolArray / PurchaseArray: no object per record at all. Each numeric field is
+      an array.array of machine values and each text field is a list. Indexing
+      gives back a small row object with the same attributes and __repr__.
+      Numbers are stored as doubles, so any int or float the plain classes take
+      is accepted, and Tool weights and Purchase costs come back as floats.
+      append() checks every value before it writes any column, so a bad value
+      leaves the columns as they were.
+"""
+
+from array import array
+
+
+class SlottedTool:
+    __slots__ = ("name", "weight")
+
+    def __init__(self, name, weight):
+        self.name = name
+        self.weight = weight
+
+    def __repr__(self):
+        return f"Tool({self.name!r}, {self.weight})"
+
+
+class SlottedPurchase:
+    __slots__ = ("description", "cost")
+
+    def __init__(self, description, cost):
+        self.description = description
+        self.cost = cost
+
+    def __repr__(self):
+        return f"Purchase ({self.description!r}, {self.cost})"
+
+
+class _Row:
+    __slots__ = ("_records", "_index")
+
+    def __init__(self, records, index):
+        self._records = records
+        self._index = index
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            # _records and _index are slots; getting here means they aren't set yet
+            # (copy and pickle look attributes up before __init__ runs)
+            raise AttributeError(name)
+        try:
+            column = self._records.columns[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        return column[self._index]
+
+    def __repr__(self):
+        return self._records.record_type.__repr__(self)
+
+
+class RecordArray:
+    """Records stored column by column; fields maps name -> array typecode or None."""
+
+    fields = {}
+    record_type = None
+
+    def __init__(self, records=()):
+        self.columns = {
+            name: list() if typecode is None else array(typecode)
+            for name, typecode in self.fields.items()
+        }
+        for record in records:
+            self.append(*(getattr(record, name) for name in self.fields))
+
+    def append(self, *values):
+        if len(values) != len(self.fields):
+            raise TypeError(f"expected {len(self.fields)} values, got {len(values)}")
+        for (name, typecode), value in zip(self.fields.items(), values):
+            if typecode is not None:
+                try:
+                    array(typecode, (value,))
+                except (TypeError, OverflowError) as error:
+                    raise TypeError(f"{name}: {error}") from None
+        for column, value in zip(self.columns.values(), values):
+            column.append(value)
+
+    def __len__(self):
+        return len(next(iter(self.columns.values())))
+
+    def __getitem__(self, index):
+        if not -len(self) <= index < len(self):
+            raise IndexError("record index out of range")
+        return _Row(self, index % len(self))
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield _Row(self, i)
+
+    def argsort(self, field, reverse=False):
+        """Row numbers ordered by one field, keyed straight off the column."""
+        return sorted(range(len(self)), key=self.columns[field].__getitem__, reverse=reverse)
+
+
+class ToolArray(RecordArray):
+    fields = {"name": None, "weight": "d"}
+    record_type = SlottedTool
+
+
+class PurchaseArray(RecordArray):
+    fields = {"description": None, "cost": "d"}
+    record_type = SlottedPurchase
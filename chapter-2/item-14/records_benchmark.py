@@ -0,0 +1,102 @@
+"""
+Bytes per record and sort throughput for dict-based, __slots__ and array-backed
+Tool and Purchase records.
+
+The names, descriptions, weights and costs are created before tracing starts and
+shared by every variant, so tracemalloc only sees what each layout itself adds per
+record. Tools are sorted by weight (floats), purchases by cost (ints).
+
+    python records_benchmark.py              # 10^6 records of each kind
+    python records_benchmark.py 100000
+"""
+
+import random
+import sys
+import tracemalloc
+from operator import attrgetter
+from time import perf_counter
+
+from records import PurchaseArray, SlottedPurchase, SlottedTool, ToolArray
+
+
+class Tool:
+    def __init__(self, name, weight):
+        self.name = name
+        self.weight = weight
+
+
+class Purchase:
+    def __init__(self, description, cost):
+        self.description = description
+        self.cost = cost
+
+
+# kind -> (plain class, slotted class, array class, text field, number field)
+LAYOUTS = {
+    "Tool": (Tool, SlottedTool, ToolArray, "name", "weight"),
+    "Purchase": (Purchase, SlottedPurchase, PurchaseArray, "description", "cost"),
+}
+
+
+def build_objects(cls, texts, numbers):
+    return [cls(t, n) for t, n in zip(texts, numbers)]
+
+
+def build_array(cls, text_field, number_field, texts, numbers):
+    records = cls()
+    records.columns[text_field].extend(texts)
+    records.columns[number_field].extend(numbers)
+    return records
+
+
+def traced(fn):
+    tracemalloc.start()
+    result = fn()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current
+
+
+def timed(fn):
+    start = perf_counter()
+    fn()
+    return perf_counter() - start
+
+
+def report(label, used, elapsed, size):
+    print(f"{label:>12} {used / size:>13.1f} {elapsed:>16.3f} {size / elapsed:>14,.0f}")
+
+
+def main(size=1_000_000):
+    data = {
+        "Tool": (
+            [f"tool-{random.randrange(1000)}" for _ in range(size)],
+            [random.uniform(0.1, 50.0) for _ in range(size)],
+        ),
+        "Purchase": (
+            [f"item-{random.randrange(1000)}" for _ in range(size)],
+            [random.randrange(10**6) for _ in range(size)],
+        ),
+    }
+
+    print(f"{size} records")
+    for kind, (plain, slotted, array_cls, text_field, number_field) in LAYOUTS.items():
+        texts, numbers = data[kind]
+        key = f"sort by {number_field} s"
+        print(f"{kind}\n{'layout':>12} {'bytes/record':>13} {key:>16} {'records/s':>14}")
+        for label, cls in (("__dict__", plain), ("__slots__", slotted)):
+            records, used = traced(lambda: build_objects(cls, texts, numbers))
+            elapsed = timed(lambda: sorted(records, key=attrgetter(number_field)))
+            report(label, used, elapsed, size)
+            del records
+
+        records, used = traced(
+            lambda: build_array(array_cls, text_field, number_field, texts, numbers)
+        )
+        elapsed = timed(lambda: records.argsort(number_field))
+        report("array", used, elapsed, size)
+        del records
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -150,3 +150,31 @@ print(purchases)
 
 purchases.sort(key=lambda x: (x.description, x.cost), reverse=True)
 print(purchases)
+
+"""
+Each of those sorts calls the lambda once per item and builds a tuple for it, and
+reverse=True flips every key at once. columnar.Columns stores description and cost
+as parallel lists and sorts a permutation of row numbers instead (np.lexsort when
+NumPy is installed), with each key ascending or descending on its own.
+See columnar_benchmark.py
+"""
+from columnar import Columns
+
+table = Columns.from_objects(purchases, "description", "cost")
+print(table.sorted("cost", "-description"))  # cheapest first, ties reverse alphabetical
+print(table.sorted("-cost").objects())
+
+"""
+Every Tool and Purchase instance also carries its own __dict__, which dominates memory
+at millions of records. records.py has __slots__ versions with the same constructor
+and repr, and array-backed PurchaseArray/ToolArray that store each field as a column.
+See records_benchmark.py for bytes per record and sort speed
+"""
+from records import PurchaseArray, SlottedPurchase
+
+compact = [SlottedPurchase(p.description, p.cost) for p in purchases]
+compact.sort(key=lambda x: x.cost)
+print(compact)
+
+packed = PurchaseArray(purchases)
+print([packed[i] for i in packed.argsort("cost")])
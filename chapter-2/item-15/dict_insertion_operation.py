@@ -72,10 +72,26 @@ print(ranks)
 winner = get_winner(ranks)
 print(winner)
 
+"""
+populate_ranks re-sorts every name each time the votes change. For a live stream
+of votes, VoteRanking keeps the names ordered as votes arrive, so each vote is an
+O(log n) update and the winner, top-K and any rank come straight off the index.
+as_ranks() / populate() give back the same ranks dict that populate_ranks builds.
+"""
+from ranking import VoteRanking
+
+live = VoteRanking(votes)
+live.add("fox", 500)
+print(live.winner(), live.top(2), live.rank("otter"))  # fox [('fox', 1363), ...] 2
+
+rebuilt = {}
+populate_ranks(dict(votes, fox=1363), rebuilt)
+assert live.as_ranks() == rebuilt
+
 from collections.abc import MutableMapping
 
 
-class SortedDict(MutableMapping):
+class NaiveSortedDict(MutableMapping):
     def __init__(self):
         self._data = {}
 
@@ -101,6 +117,23 @@ class SortedDict(MutableMapping):
         return repr(self._data)
 
 
+ranks = NaiveSortedDict()
+populate_ranks(votes, ranks)
+print(ranks)
+
+"""
+NaiveSortedDict copies and re-sorts every key each time it is iterated, so a table
+that is read thousands of times between writes pays O(n log n) per pass.
+
+sorted_dict.SortedDict keeps a sorted key index that is updated in __setitem__ and
+__delitem__, so iteration is just a walk over the index. It also supports range
+queries, rank lookups and positional access. See sorted_dict_benchmark.py
+"""
+from sorted_dict import SortedDict
+
 ranks = SortedDict()
 populate_ranks(votes, ranks)
 print(ranks)
+print(list(ranks.irange("fox", "otter")))  # ['fox', 'otter']
+print(ranks.bisect_left("otter"))  # 1 -> 'otter' is the 2nd key
+print(ranks.peekitem(0))  # ('fox', 2)
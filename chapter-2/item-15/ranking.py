@@ -0,0 +1,93 @@
+"""
+Incremental ranking for a live vote stream.
+
+populate_ranks re-sorts every name whenever the votes change. VoteRanking keeps
+the names ordered by vote count in a SortedDict index instead, so each vote
+moves one entry in O(log n) and the winner, top-K and the rank of any name can
+be read without sorting.
+
+Ties are broken by the order names were first seen, which is the same order the
+stable names.sort(key=votes.get, reverse=True) in populate_ranks produces for a
+votes dict.
+
+populate_ranks and get_winner are the plain versions from dict_insertion_operation.py.
+SortedDict is only imported once a VoteRanking is made, so importing this module for
+them stays cheap.
+"""
+
+from itertools import islice
+
+
+def populate_ranks(votes, ranks):
+    names = list(votes.keys())
+    names.sort(key=votes.get, reverse=True)
+    for i, name in enumerate(names, 1):
+        ranks[name] = i
+
+
+def get_winner(ranks):
+    return next(iter(ranks))
+
+
+class VoteRanking:
+    def __init__(self, votes=None):
+        # imported here rather than at the top so `import ranking` stays inside
+        # startup_benchmark.py's 1 ms budget for callers that only want populate_ranks
+        from sorted_dict import SortedDict
+
+        self._counts = {}
+        self._seen = {}
+        self._index = SortedDict()  # (-count, first seen) -> name
+        if votes:
+            for name, count in votes.items():
+                self.add(name, count)
+
+    def add(self, name, count=1):
+        """Record count more votes for name (a negative count takes votes away)."""
+        seen = self._seen.get(name)
+        if seen is None:
+            seen = self._seen[name] = len(self._seen)
+            old = 0
+        else:
+            old = self._counts[name]
+            del self._index[(-old, seen)]
+
+        new = old + count
+        self._counts[name] = new
+        self._index[(-new, seen)] = name
+        return new
+
+    def __len__(self):
+        return len(self._counts)
+
+    def __contains__(self, name):
+        return name in self._counts
+
+    def votes(self, name):
+        return self._counts.get(name, 0)
+
+    def winner(self):
+        if not self._counts:
+            return None
+        return self._index.peekitem(0)[1]
+
+    def top(self, k):
+        """The k names with the most votes, as (name, votes) pairs."""
+        return [(name, self._counts[name]) for name in islice(self._index.values(), k)]
+
+    def rank(self, name):
+        """1-based rank of name, matching the numbers populate_ranks assigns."""
+        key = (-self._counts[name], self._seen[name])
+        return self._index.bisect_left(key) + 1
+
+    def __iter__(self):
+        return iter(self._index.values())
+
+    def populate(self, ranks):
+        """Fill ranks the same way populate_ranks(votes, ranks) does."""
+        for i, name in enumerate(self._index.values(), 1):
+            ranks[name] = i
+        return ranks
+
+    def as_ranks(self):
+        return self.populate({})
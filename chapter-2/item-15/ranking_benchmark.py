@@ -0,0 +1,50 @@
+"""
+Replay a stream of votes and keep the ranks current after every batch, once by
+re-running populate_ranks and once with the incremental VoteRanking.
+
+    python ranking_benchmark.py                  # 10^4 names, 10^6 votes, refresh every 100
+    python ranking_benchmark.py 1000 100000 100  # names, votes, votes per refresh
+"""
+
+import random
+import sys
+from time import perf_counter
+
+from ranking import VoteRanking, populate_ranks
+
+
+def rebuild(stream, every):
+    votes = {}
+    ranks = {}
+    winner = None  # stays None when there are fewer than `every` votes
+    for i, name in enumerate(stream, 1):
+        votes[name] = votes.get(name, 0) + 1
+        if i % every == 0:
+            ranks = {}
+            populate_ranks(votes, ranks)
+            winner = next(iter(ranks))
+    return winner
+
+
+def incremental(stream, every):
+    ranking = VoteRanking()
+    winner = None
+    for i, name in enumerate(stream, 1):
+        ranking.add(name)
+        if i % every == 0:
+            winner = ranking.winner()
+    return winner
+
+
+def main(names=10_000, events=1_000_000, every=100):
+    stream = random.choices(range(names), k=events)
+    print(f"{names} names, {events} votes, refreshing ranks every {every} votes")
+    for fn in (rebuild, incremental):
+        start = perf_counter()
+        winner = fn(stream, every)
+        elapsed = perf_counter() - start
+        print(f"{fn.__name__:>12}: {elapsed:8.3f} s  {events / elapsed:12,.0f} votes/s  winner={winner}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,191 @@
+"""
+A SortedDict that keeps its keys in order as they are written, instead of
+copying and re-sorting every key each time the dict is iterated.
+
+The sorted key index is a list of small sorted lists (the same layout the
+sortedcontainers package uses). Inserting or deleting a key only shifts one
+sublist of at most ~2 * LOAD items, so writes stay cheap even at millions of
+keys, and iteration just walks the sublists in order with no extra allocation.
+
+    - _lists: the sorted sublists
+    - _maxes: the last (largest) key of each sublist, used to bisect to the
+      right sublist
+    - _offsets: cumulative sublist lengths, rebuilt lazily for positional lookups
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import MutableMapping
+from itertools import accumulate, chain, islice
+
+LOAD = 1000
+
+
+class SortedDict(MutableMapping):
+    def __init__(self, *args, **kwargs):
+        self._data = {}
+        self._lists = []
+        self._maxes = []
+        self._offsets = None
+        self.update(*args, **kwargs)
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __setitem__(self, key, value):
+        if key not in self._data:
+            self._insert(key)
+        self._data[key] = value
+
+    def __delitem__(self, key):
+        del self._data[key]
+        self._remove(key)
+
+    def __iter__(self):
+        return chain.from_iterable(self._lists)
+
+    def __reversed__(self):
+        for keys in reversed(self._lists):
+            yield from reversed(keys)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __repr__(self):
+        items = ", ".join(f"{key!r}: {self._data[key]!r}" for key in self)
+        return "{" + items + "}"
+
+    def clear(self):
+        self._data.clear()
+        self._lists.clear()
+        self._maxes.clear()
+        self._offsets = None
+
+    # sorted index maintenance
+
+    def _insert(self, key):
+        self._offsets = None
+        if not self._maxes:
+            self._lists.append([key])
+            self._maxes.append(key)
+            return
+
+        pos = bisect_right(self._maxes, key)
+        if pos == len(self._maxes):
+            # larger than everything so far, append to the last sublist
+            pos -= 1
+            self._lists[pos].append(key)
+            self._maxes[pos] = key
+        else:
+            insort(self._lists[pos], key)
+
+        if len(self._lists[pos]) > 2 * LOAD:
+            keys = self._lists[pos]
+            self._lists[pos : pos + 1] = [keys[:LOAD], keys[LOAD:]]
+            self._maxes[pos : pos + 1] = [keys[LOAD - 1], keys[-1]]
+
+    def _remove(self, key):
+        self._offsets = None
+        pos = bisect_left(self._maxes, key)
+        keys = self._lists[pos]
+        del keys[bisect_left(keys, key)]
+
+        if not keys:
+            del self._lists[pos]
+            del self._maxes[pos]
+        else:
+            self._maxes[pos] = keys[-1]
+
+    def _locate(self, index):
+        """Map a flat position to (sublist position, index within that sublist)."""
+        size = len(self._data)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("SortedDict index out of range")
+
+        if self._offsets is None:
+            self._offsets = list(accumulate(map(len, self._lists)))
+        pos = bisect_right(self._offsets, index)
+        if pos:
+            index -= self._offsets[pos - 1]
+        return pos, index
+
+    def _position(self, key, bisect_fn):
+        pos = bisect_left(self._maxes, key)
+        if pos == len(self._maxes):
+            return len(self._data)
+        if self._offsets is None:
+            self._offsets = list(accumulate(map(len, self._lists)))
+        before = self._offsets[pos - 1] if pos else 0
+        return before + bisect_fn(self._lists[pos], key)
+
+    # queries
+
+    def bisect_left(self, key):
+        """Number of keys strictly less than key, i.e. the rank of key."""
+        return self._position(key, bisect_left)
+
+    def bisect_right(self, key):
+        """Number of keys less than or equal to key."""
+        return self._position(key, bisect_right)
+
+    bisect = bisect_right
+
+    def index(self, key):
+        if key not in self._data:
+            raise KeyError(key)
+        return self.bisect_left(key)
+
+    def peekitem(self, index=-1):
+        """Return the (key, value) pair at a sorted position without removing it."""
+        pos, idx = self._locate(index)
+        key = self._lists[pos][idx]
+        return key, self._data[key]
+
+    def popitem(self, index=-1):
+        key, value = self.peekitem(index)
+        del self[key]
+        return key, value
+
+    def irange(self, lo=None, hi=None, inclusive=(True, True), reverse=False):
+        """Iterate keys between lo and hi in sorted order.
+
+        None means unbounded on that side, like a missing slice index.
+        """
+        start = 0
+        stop = len(self._data)
+        if lo is not None:
+            start = self.bisect_left(lo) if inclusive[0] else self.bisect_right(lo)
+        if hi is not None:
+            stop = self.bisect_right(hi) if inclusive[1] else self.bisect_left(hi)
+        if start >= stop:
+            return iter(())
+        if reverse:
+            return self._islice_reversed(start, stop)
+        return self._islice(start, stop)
+
+    def _islice(self, start, stop):
+        pos, idx = self._locate(start)
+        remaining = stop - start
+        for keys in islice(self._lists, pos, None):
+            chunk = keys[idx : idx + remaining]
+            yield from chunk
+            remaining -= len(chunk)
+            if not remaining:
+                return
+            idx = 0
+
+    def _islice_reversed(self, start, stop):
+        pos, idx = self._locate(stop - 1)
+        remaining = stop - start
+        while remaining:
+            keys = self._lists[pos]
+            chunk = keys[max(idx - remaining + 1, 0) : idx + 1]
+            yield from reversed(chunk)
+            remaining -= len(chunk)
+            pos -= 1
+            if pos >= 0:
+                idx = len(self._lists[pos]) - 1
@@ -0,0 +1,90 @@
+"""
+Compare the naive re-sort-on-iteration SortedDict with the indexed one in
+sorted_dict.py.
+
+    python sorted_dict_benchmark.py            # 10^3 .. 10^6 keys
+    python sorted_dict_benchmark.py 100000     # stop at 10^5 keys
+"""
+
+import random
+import sys
+from collections.abc import MutableMapping
+from time import perf_counter
+
+from sorted_dict import SortedDict
+
+
+class NaiveSortedDict(MutableMapping):
+    def __init__(self):
+        self._data = {}
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __setitem__(self, key, value):
+        self._data[key] = value
+
+    def __delitem__(self, key):
+        del self._data[key]
+
+    def __iter__(self):
+        keys = list(self._data.keys())
+        keys.sort()
+        for key in keys:
+            yield key
+
+    def __len__(self):
+        return len(self._data)
+
+
+def timed(fn):
+    start = perf_counter()
+    fn()
+    return perf_counter() - start
+
+
+def fill(mapping, keys):
+    for key in keys:
+        mapping[key] = key
+
+
+def iterate(mapping, passes):
+    for _ in range(passes):
+        for _ in mapping:
+            pass
+
+
+def bench(size, passes=10):
+    keys = random.sample(range(size * 10), size)
+    results = {}
+    for cls in (NaiveSortedDict, SortedDict):
+        mapping = cls()
+        write = timed(lambda: fill(mapping, keys))
+        read = timed(lambda: iterate(mapping, passes))
+        results[cls.__name__] = (write, read / passes)
+
+    indexed = SortedDict((key, key) for key in keys)
+    probes = random.sample(keys, min(size, 10_000))
+    rank = timed(lambda: [indexed.bisect_left(key) for key in probes]) / len(probes)
+    peek = timed(lambda: [indexed.peekitem(i) for i in range(len(probes))]) / len(probes)
+    return results, rank, peek
+
+
+def main(max_size=1_000_000):
+    print(f"{'keys':>9} {'impl':>16} {'fill s':>9} {'iter s':>9}")
+    size = 1_000
+    while size <= max_size:
+        results, rank, peek = bench(size)
+        for name, (write, read) in results.items():
+            print(f"{size:>9} {name:>16} {write:>9.4f} {read:>9.4f}")
+        naive_read = results["NaiveSortedDict"][1]
+        indexed_read = results["SortedDict"][1]
+        print(
+            f"{'':>9} iter speedup {naive_read / indexed_read:.1f}x, "
+            f"rank {rank * 1e6:.2f} us, peekitem {peek * 1e6:.2f} us"
+        )
+        size *= 10
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
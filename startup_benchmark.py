@@ -0,0 +1,160 @@
+"""
+What does importing each script in this repo cost?
+
+Most of the item scripts are notes that do all their work at import: printing,
+sorting, writing files, logging.basicConfig. Reusing a function from one of them
+means paying for all of that. The reusable code lives in side-effect-free library
+modules next to the notes (LIBRARY below), and this checks that they stay cheap.
+
+For every module it runs a fresh interpreter and records:
+
+    - import: the module's cumulative time from python -X importtime, so the
+      interpreter's own startup isn't counted
+    - wall: how much longer `import module` takes than an empty interpreter
+
+Both are the best of --repeat runs, after one warm-up run so the .pyc files are
+written and compile time isn't counted (PYTHONDONTWRITEBYTECODE is cleared for
+the runs). Modules run in an empty temporary directory, so notes that write files
+don't touch the repo, and CAPABILITIES_CACHE points capabilities.py's cache there
+instead of at the home directory.
+
+Library modules are also checked for side effects (anything printed or any file
+created) and for exporting their functions, and flagged when their import time is
+over --budget milliseconds.
+
+    python startup_benchmark.py                   # every module
+    python startup_benchmark.py --library         # library modules only
+    python startup_benchmark.py --library --check # exit 1 if any library check fails
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+ROOT = Path(__file__).resolve().parent
+
+LIBRARY = {
+    "chapter-1/item-3/conversion.py": ["to_str", "to_bytes", "to_str_batch", "decode_chunks"],
+    "chapter-1/item-5/query.py": ["get_first_int", "QuerySchema"],
+    "chapter-1/item-6/sorting.py": ["bubble_sort", "insertion_sort", "merge_sort", "sort"],
+    "chapter-1/item-9/coprime.py": ["coprime", "binary_gcd", "coprime_batch"],
+    "chapter-2/item-15/ranking.py": ["populate_ranks", "get_winner", "VoteRanking"],
+}
+
+IMPORT = "import sys; sys.path.insert(0, {directory!r}); __import__({name!r})"
+CHECK = IMPORT + "; print(*[n for n in {names!r} if not hasattr(sys.modules[{name!r}], n)])"
+
+
+def modules():
+    return sorted(
+        path.relative_to(ROOT).as_posix()
+        for path in ROOT.glob("chapter-*/**/*.py")
+    )
+
+
+def _run(code, importtime=False, timeout=120):
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    command = [sys.executable, *(["-X", "importtime"] if importtime else []), "-c", code]
+    with tempfile.TemporaryDirectory() as cwd:
+        env["CAPABILITIES_CACHE"] = cwd
+        start = perf_counter()
+        result = subprocess.run(
+            command, cwd=cwd, env=env, capture_output=True, text=True, timeout=timeout
+        )
+        elapsed = perf_counter() - start
+        created = os.listdir(cwd)
+    return result, elapsed, created
+
+
+def _import_us(stderr, name):
+    """Cumulative microseconds for name's top-level line in -X importtime output."""
+    for line in reversed(stderr.splitlines()):
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) == 3 and fields[2].rstrip() == f" {name}":
+            return int(fields[1])
+    return None
+
+
+def measure(relative, repeat, baseline):
+    path = ROOT / relative
+    name, directory = path.stem, str(path.parent)
+    code = IMPORT.format(directory=directory, name=name)
+    try:
+        warm, _, created = _run(code)
+    except subprocess.TimeoutExpired:
+        return {"module": relative, "error": "timed out"}
+    if warm.returncode:
+        return {"module": relative, "error": warm.stderr.strip().splitlines()[-1]}
+
+    import_us = []
+    wall = []
+    for _ in range(repeat):
+        result, _, _ = _run(code, importtime=True)
+        import_us.append(_import_us(result.stderr, name))
+        _, elapsed, _ = _run(code)
+        wall.append(elapsed)
+    report = {
+        "module": relative,
+        "import_ms": min(import_us) / 1000 if None not in import_us else None,
+        "wall_ms": max(0.0, min(wall) - baseline) * 1000,
+        "printed": bool(warm.stdout),
+        "created": created,
+    }
+    if relative in LIBRARY:
+        check, _, _ = _run(CHECK.format(directory=directory, name=name, names=LIBRARY[relative]))
+        report["missing"] = check.stdout.split()
+    return report
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description="Import cost of every module in the repo")
+    parser.add_argument("--library", action="store_true", help="only the library modules")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per module, best kept")
+    parser.add_argument("--budget", type=float, default=1.0, help="library budget in ms")
+    parser.add_argument("--check", action="store_true", help="exit 1 if a library check fails")
+    options = parser.parse_args(args)
+
+    baseline = min(_run("pass")[1] for _ in range(max(options.repeat, 3)))
+    print(f"python {sys.version.split()[0]}, empty interpreter {baseline * 1000:.1f} ms")
+    print(f"{'module':<60} {'import ms':>10} {'wall ms':>8}  notes")
+
+    failed = False
+    for relative in sorted(LIBRARY) if options.library else modules():
+        if Path(relative).name == Path(__file__).name:
+            continue
+        report = measure(relative, options.repeat, baseline)
+        if "error" in report:
+            print(f"{relative:<60} {'-':>10} {'-':>8}  error: {report['error']}")
+            failed |= relative in LIBRARY
+            continue
+
+        notes = []
+        if report["printed"]:
+            notes.append("prints")
+        if report["created"]:
+            notes.append("creates " + ", ".join(report["created"]))
+        if relative in LIBRARY:
+            problems = list(notes)
+            if report["import_ms"] is None or report["import_ms"] > options.budget:
+                problems.append(f"over {options.budget:g} ms budget")
+            if report["missing"]:
+                problems.append("missing " + ", ".join(report["missing"]))
+            notes = ["library " + ("FAIL: " + "; ".join(problems) if problems else "ok")]
+            failed |= bool(problems)
+
+        import_ms = f"{report['import_ms']:.2f}" if report["import_ms"] is not None else "-"
+        print(f"{relative:<60} {import_ms:>10} {report['wall_ms']:8.1f}  {'; '.join(notes)}")
+
+    if options.check and failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()